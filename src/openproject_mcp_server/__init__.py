@@ -10,6 +10,8 @@ standardized interface.
 import os
 import json
 import logging
+import time
+from collections import deque
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import asyncio
@@ -19,12 +21,17 @@ import base64
 import ssl
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib when orjson cannot be installed
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
 logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
@@ -34,11 +41,108 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __license__ = "MIT"
 
+# JSON helpers: use orjson when available, fall back to the stdlib otherwise.
+# _dumps always returns str so results can be used directly in query strings.
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Statuses that signal the server is overloaded and we should back off
+_OVERLOAD_STATUSES = frozenset({429, 502, 503})
+
+
+class OpenProjectAPIError(Exception):
+    """Error response returned by the OpenProject API"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _AdmissionController:
+    """
+    AIMD limit on concurrent API requests.
+
+    The limit grows by one after each full window of successful requests
+    whose average latency stays within LATENCY_SLACK of the best window seen
+    since the last cut, and halves once per congestion event when the server
+    answers with an overload status. Overload responses to requests that
+    were already in flight when the limit was last cut belong to the same
+    event and do not cut it again.
+    """
+
+    LATENCY_SLACK = 1.5
+
+    def __init__(
+        self, initial: int = 8, minimum: int = 2, maximum: int = 32, window: int = 32
+    ):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+        self._latencies: deque = deque(maxlen=window)
+        self._best_latency: Optional[float] = None
+        self._last_decrease = float("-inf")
+
+    async def __aenter__(self) -> "_AdmissionController":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful request; grow the limit after a healthy window"""
+        self._latencies.append(latency)
+        if len(self._latencies) < self._latencies.maxlen:
+            return
+        average = sum(self._latencies) / len(self._latencies)
+        self._latencies.clear()
+        if self._best_latency is None or average < self._best_latency:
+            self._best_latency = average
+        if average <= self._best_latency * self.LATENCY_SLACK:
+            self.limit = min(self.maximum, self.limit + 1)
+
+    def record_overload(self, started: float) -> None:
+        """
+        Halve the limit after the server signalled overload.
+
+        Args:
+            started: time.monotonic() at which the overloaded request was sent
+        """
+        if started <= self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self.limit = max(self.minimum, self.limit // 2)
+        self._latencies.clear()
+        # Latency before the overload is no baseline for the recovered server
+        self._best_latency = None
+        logger.warning("OpenProject overloaded, concurrency limit now %s", self.limit)
+
 
 class OpenProjectClient:
     """Client for the OpenProject API v3 with optional proxy support"""
 
-    def __init__(self, base_url: str, api_key: str, proxy: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        proxy: Optional[str] = None,
+        pool_size: int = 64,
+        pool_size_per_host: int = 32,
+        keepalive_timeout: float = 60.0,
+    ):
         """
         Initialize the OpenProject client.
 
@@ -46,10 +150,31 @@ class OpenProjectClient:
             base_url: The base URL of the OpenProject instance
             api_key: API key for authentication
             proxy: Optional HTTP proxy URL
+            pool_size: Maximum number of pooled connections
+            pool_size_per_host: Maximum number of pooled connections per host
+            keepalive_timeout: Seconds an idle pooled connection is kept open
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.proxy = proxy
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+
+        # Shared HTTP session, created lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Adaptive cap on concurrent requests, shared by every caller; kept
+        # within the per-host pool so admitted requests never queue for a
+        # connection and run into the connect timeout
+        self._admission = _AdmissionController(
+            initial=min(8, pool_size_per_host),
+            minimum=min(2, pool_size_per_host),
+            maximum=min(32, pool_size_per_host),
+        )
+
+        # Last ETag and parsed body per URL for conditional GETs
+        self._etag_cache: Dict[str, tuple] = {}
 
         # Setup headers with Basic Auth
         self.headers = {
@@ -59,15 +184,38 @@ class OpenProjectClient:
             "User-Agent": f"OpenProject-MCP/{__version__}",
         }
 
-        logger.info(f"OpenProject Client initialized for: {self.base_url}")
+        logger.info("OpenProject Client initialized for: %s", self.base_url)
         if self.proxy:
-            logger.info(f"Using proxy: {self.proxy}")
+            logger.info("Using proxy: %s", self.proxy)
 
     def _encode_api_key(self) -> str:
         """Encode API key for Basic Auth"""
         credentials = f"apikey:{self.api_key}"
         return base64.b64encode(credentials.encode()).decode()
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            # Configure SSL, connection pooling and timeout
+            ssl_context = ssl.create_default_context()
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit=self.pool_size,
+                limit_per_host=self.pool_size_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            timeout = aiohttp.ClientTimeout(total=30, connect=5)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout, json_serialize=_dumps
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session and release pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def _normalize_endpoint(self, href: str) -> str:
         """Normalize API hrefs to relative /api/v3 endpoints for _request."""
         endpoint = href
@@ -78,7 +226,11 @@ class OpenProjectClient:
         return endpoint
 
     async def _request(
-        self, method: str, endpoint: str, data: Optional[Dict] = None
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        conditional: bool = False,
     ) -> Dict:
         """
         Execute an API request.
@@ -87,65 +239,86 @@ class OpenProjectClient:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             data: Optional request body data
+            conditional: Revalidate a GET with its last ETag and reuse the
+                previously parsed body when the server answers 304
 
         Returns:
             Dict: Response data from the API
 
         Raises:
-            Exception: If the request fails
+            OpenProjectAPIError: If the API returns an error status
+            Exception: If the request fails at the network level
         """
         url = f"{self.base_url}/api/v3{endpoint}"
 
-        logger.debug(f"API Request: {method} {url}")
-        if data:
-            logger.debug(f"Request body: {json.dumps(data, indent=2)}")
-
-        # Configure SSL and timeout
-        ssl_context = ssl.create_default_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        timeout = aiohttp.ClientTimeout(total=30)
-
-        async with aiohttp.ClientSession(
-            connector=connector, timeout=timeout
-        ) as session:
-            try:
-                # Build request parameters
-                request_params = {
-                    "method": method,
-                    "url": url,
-                    "headers": self.headers,
-                    "json": data,
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API Request: %s %s", method, url)
+            if data:
+                logger.debug("Request body: %s", json.dumps(data, indent=2))
+
+        session = self._get_session()
+        try:
+            # Build request parameters
+            request_params = {
+                "method": method,
+                "url": url,
+                "headers": self.headers,
+                "json": data,
+            }
+
+            # Revalidate cached reference data instead of downloading it again
+            cached = self._etag_cache.get(url) if conditional else None
+            if cached is not None:
+                request_params["headers"] = {
+                    **self.headers,
+                    "If-None-Match": cached[0],
                 }
 
-                # Add proxy if configured
-                if self.proxy:
-                    request_params["proxy"] = self.proxy
+            # Add proxy if configured
+            if self.proxy:
+                request_params["proxy"] = self.proxy
 
+            async with self._admission:
+                started = time.monotonic()
                 async with session.request(**request_params) as response:
-                    response_text = await response.text()
+                    # Parse the raw body; orjson decodes bytes without a str copy
+                    response_body = await response.read()
+
+                    logger.debug("Response status: %s", response.status)
 
-                    logger.debug(f"Response status: {response.status}")
+                    if cached is not None and response.status == 304:
+                        self._admission.record_success(time.monotonic() - started)
+                        return cached[1]
 
                     # Parse response
                     try:
-                        response_json = (
-                            json.loads(response_text) if response_text else {}
+                        response_json = _loads(response_body) if response_body else {}
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        logger.error(
+                            "Invalid JSON response: %s...",
+                            response_body[:200].decode(errors="replace"),
                         )
-                    except json.JSONDecodeError:
-                        logger.error(f"Invalid JSON response: {response_text[:200]}...")
                         response_json = {}
 
                     # Handle errors
                     if response.status >= 400:
                         error_msg = self._format_error_message(
-                            response.status, response_text
+                            response.status, response_body.decode(errors="replace")
                         )
-                        raise Exception(error_msg)
+                        if response.status in _OVERLOAD_STATUSES:
+                            self._admission.record_overload(started)
+                        raise OpenProjectAPIError(response.status, error_msg)
 
-                return response_json
-            except aiohttp.ClientError as e:
-                logger.error(f"Network error: {str(e)}")
-                raise Exception(f"Network error accessing {url}: {str(e)}")
+                    etag = response.headers.get("ETag") if conditional else None
+                    if etag:
+                        self._etag_cache[url] = (etag, response_json)
+
+                self._admission.record_success(time.monotonic() - started)
+
+            return response_json
+        except aiohttp.ClientError as e:
+            logger.error("Network error: %s", e)
+            raise Exception(f"Network error accessing {url}: {str(e)}")
 
     async def get_version_name(self, version_link: Optional[Dict]) -> Optional[str]:
         """Resolve version name from a link, fetching the version if needed."""
@@ -187,20 +360,37 @@ class OpenProjectClient:
         logger.info("Testing API connection...")
         return await self._request("GET", "")
 
-    async def get_projects(self, filters: Optional[str] = None) -> Dict:
+    async def get_projects(
+        self,
+        filters: Optional[str] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> Dict:
         """
         Retrieve all projects.
 
         Args:
             filters: Optional JSON-encoded filter string
+            offset: Optional page number for pagination
+            page_size: Optional number of results per page
 
         Returns:
             Dict: API response containing projects
         """
         endpoint = "/projects"
+
+        # Build query parameters
+        query_params = []
         if filters:
             encoded_filters = quote(filters)
-            endpoint += f"?filters={encoded_filters}"
+            query_params.append(f"filters={encoded_filters}")
+        if offset is not None:
+            query_params.append(f"offset={offset}")
+        if page_size is not None:
+            query_params.append(f"pageSize={page_size}")
+
+        if query_params:
+            endpoint += "?" + "&".join(query_params)
 
         result = await self._request("GET", endpoint)
 
@@ -353,7 +543,7 @@ class OpenProjectClient:
         else:
             endpoint = "/types"
 
-        result = await self._request("GET", endpoint)
+        result = await self._request("GET", endpoint, conditional=True)
 
         # Ensure proper response structure
         if "_embedded" not in result:
@@ -363,22 +553,39 @@ class OpenProjectClient:
 
         return result
 
-    async def get_users(self, filters: Optional[str] = None) -> Dict:
+    async def get_users(
+        self,
+        filters: Optional[str] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> Dict:
         """
         Retrieve users.
 
         Args:
             filters: Optional JSON-encoded filter string
+            offset: Optional page number for pagination
+            page_size: Optional number of results per page
 
         Returns:
             Dict: API response containing users
         """
         endpoint = "/users"
+
+        # Build query parameters
+        query_params = []
         if filters:
             encoded_filters = quote(filters)
-            endpoint += f"?filters={encoded_filters}"
+            query_params.append(f"filters={encoded_filters}")
+        if offset is not None:
+            query_params.append(f"offset={offset}")
+        if page_size is not None:
+            query_params.append(f"pageSize={page_size}")
 
-        result = await self._request("GET", endpoint)
+        if query_params:
+            endpoint += "?" + "&".join(query_params)
+
+        result = await self._request("GET", endpoint, conditional=True)
 
         # Ensure proper response structure
         if "_embedded" not in result:
@@ -401,7 +608,11 @@ class OpenProjectClient:
         return await self._request("GET", f"/users/{user_id}")
 
     async def get_memberships(
-        self, project_id: Optional[int] = None, user_id: Optional[int] = None
+        self,
+        project_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
     ) -> Dict:
         """
         Retrieve memberships.
@@ -409,6 +620,8 @@ class OpenProjectClient:
         Args:
             project_id: Optional project ID to filter memberships by project
             user_id: Optional user ID to filter memberships by user
+            offset: Optional page number for pagination
+            page_size: Optional number of results per page
 
         Returns:
             Dict: API response containing memberships
@@ -422,9 +635,18 @@ class OpenProjectClient:
         if user_id:
             filters.append({"user": {"operator": "=", "values": [str(user_id)]}})
 
+        # Build query parameters
+        query_params = []
         if filters:
-            filter_string = quote(json.dumps(filters))
-            endpoint += f"?filters={filter_string}"
+            filter_string = quote(_dumps(filters))
+            query_params.append(f"filters={filter_string}")
+        if offset is not None:
+            query_params.append(f"offset={offset}")
+        if page_size is not None:
+            query_params.append(f"pageSize={page_size}")
+
+        if query_params:
+            endpoint += "?" + "&".join(query_params)
 
         result = await self._request("GET", endpoint)
 
@@ -443,7 +665,7 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing statuses
         """
-        result = await self._request("GET", "/statuses")
+        result = await self._request("GET", "/statuses", conditional=True)
 
         # Ensure proper response structure
         if "_embedded" not in result:
@@ -460,7 +682,7 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing priorities
         """
-        result = await self._request("GET", "/priorities")
+        result = await self._request("GET", "/priorities", conditional=True)
 
         # Ensure proper response structure
         if "_embedded" not in result:
@@ -623,20 +845,37 @@ class OpenProjectClient:
         await self._request("DELETE", f"/work_packages/{work_package_id}")
         return True
 
-    async def get_time_entries(self, filters: Optional[str] = None) -> Dict:
+    async def get_time_entries(
+        self,
+        filters: Optional[str] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> Dict:
         """
         Retrieve time entries.
 
         Args:
             filters: Optional JSON-encoded filter string
+            offset: Optional page number for pagination
+            page_size: Optional number of results per page
 
         Returns:
             Dict: API response containing time entries
         """
         endpoint = "/time_entries"
+
+        # Build query parameters
+        query_params = []
         if filters:
             encoded_filters = quote(filters)
-            endpoint += f"?filters={encoded_filters}"
+            query_params.append(f"filters={encoded_filters}")
+        if offset is not None:
+            query_params.append(f"offset={offset}")
+        if page_size is not None:
+            query_params.append(f"pageSize={page_size}")
+
+        if query_params:
+            endpoint += "?" + "&".join(query_params)
 
         result = await self._request("GET", endpoint)
 
@@ -736,7 +975,9 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing activities
         """
-        result = await self._request("GET", "/time_entries/activities")
+        result = await self._request(
+            "GET", "/time_entries/activities", conditional=True
+        )
 
         # Ensure proper response structure
         if "_embedded" not in result:
@@ -746,12 +987,19 @@ class OpenProjectClient:
 
         return result
 
-    async def get_versions(self, project_id: Optional[int] = None) -> Dict:
+    async def get_versions(
+        self,
+        project_id: Optional[int] = None,
+        offset: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> Dict:
         """
         Retrieve project versions.
 
         Args:
             project_id: Optional project ID to filter versions by project
+            offset: Optional page number for pagination
+            page_size: Optional number of results per page
 
         Returns:
             Dict: API response containing versions
@@ -761,6 +1009,16 @@ class OpenProjectClient:
         else:
             endpoint = "/versions"
 
+        # Build query parameters
+        query_params = []
+        if offset is not None:
+            query_params.append(f"offset={offset}")
+        if page_size is not None:
+            query_params.append(f"pageSize={page_size}")
+
+        if query_params:
+            endpoint += "?" + "&".join(query_params)
+
         result = await self._request("GET", endpoint)
 
         # Ensure proper response structure
@@ -812,7 +1070,7 @@ class OpenProjectClient:
             # Get current user info which includes permissions
             return await self._request("GET", "/users/me")
         except Exception as e:
-            logger.error(f"Failed to check permissions: {e}")
+            logger.error("Failed to check permissions: %s", e)
             return {}
 
     async def create_project(self, data: Dict) -> Dict:
@@ -921,7 +1179,7 @@ class OpenProjectClient:
         Returns:
             Dict: API response containing roles
         """
-        result = await self._request("GET", "/roles")
+        result = await self._request("GET", "/roles", conditional=True)
 
         # Ensure proper response structure
         if "_embedded" not in result:
@@ -1111,12 +1369,12 @@ class OpenProjectClient:
         """
         if include_descendants:
             # Use descendants filter to get all levels
-            filters = json.dumps(
+            filters = _dumps(
                 [{"descendantsOf": {"operator": "=", "values": [str(parent_id)]}}]
             )
         else:
             # Use parent filter to get direct children only
-            filters = json.dumps(
+            filters = _dumps(
                 [{"parent": {"operator": "=", "values": [str(parent_id)]}}]
             )
 
@@ -1244,5 +1502,11 @@ class OpenProjectClient:
 
 
 # Export main components
-__all__ = ["OpenProjectClient", "__version__", "__author__", "__license__"]
+__all__ = [
+    "OpenProjectClient",
+    "OpenProjectAPIError",
+    "__version__",
+    "__author__",
+    "__license__",
+]
 
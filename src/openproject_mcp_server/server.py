@@ -7,55 +7,311 @@ integration with OpenProject API v3.
 """
 
 import os
+import asyncio
+import functools
 import logging
-import json
-from typing import Optional
-from dotenv import load_dotenv
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from fastmcp import FastMCP
 
-# Import OpenProject client from existing module
-from . import OpenProjectClient, __version__
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and not available on Windows
+    uvloop = None
 
-# Load environment variables
-load_dotenv()
+# Import OpenProject client from existing module
+from . import OpenProjectClient, __version__, _dumps
 
-# Configure logging
-logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Environment variables (.env) and logging are set up by the package on import
 logger = logging.getLogger(__name__)
 
+# Shared read-only stand-in for missing nested objects in API responses
+_EMPTY = MappingProxyType({})
+
+# Bound lookup for the HAL "_embedded" object in hot row loops
+_get_emb = itemgetter("_embedded")
+
+# Bound once; tool error paths log lazily with %-style arguments
+_log_err = logger.error
+
+# Status glyphs used when rendering projects
+_ACTIVE, _ARCHIVED, _PROJ_ICON = "🟢", "🔴", "📋"
+
+# Constant filters, serialized once at import time
+_ACTIVE_ONLY_FILTER = _dumps([{"active": {"operator": "=", "values": ["t"]}}])
+_ACTIVE_USER_FILTER = _dumps([{"status": {"operator": "=", "values": ["active"]}}])
+_STATUS_FILTERS = {
+    "open": _dumps([{"status": {"operator": "o", "values": []}}]),
+    "closed": _dumps([{"status": {"operator": "c", "values": []}}]),
+    "all": None,
+}
+
+# Pagination for list tools; OpenProject's offset is a 1-based page number
+_DEFAULT_PAGE_SIZE = 25
+_MAX_PAGE_SIZE = 100
+
+
+# Output format for list tools: Markdown for people, raw JSON for programs
+OutputFormat = Literal["md", "json"]
+
+
+def _page_size(page_size: Optional[int]) -> int:
+    """Clamp a requested page size to 1.._MAX_PAGE_SIZE"""
+    return max(1, min(page_size or _DEFAULT_PAGE_SIZE, _MAX_PAGE_SIZE))
+
+
+def _page_info(count: int, result: Dict[str, Any], offset: Optional[int]) -> str:
+    """Header fragment like "25 of 310, page offset=1" for paginated lists"""
+    return f"{count} of {result.get('total', count)}, page offset={offset or 1}"
+
+
+def tool_errors(what: str):
+    """
+    Decorate a tool so failures are logged and returned as an error message.
+    
+    Args:
+        what: Action for the log line, e.g. "listing work packages"
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                _log_err("Error %s: %s", what, e, exc_info=True)
+                return f"❌ Error: {str(e)}"
+        return wrapper
+    return decorator
+
+
+def _pack(local: Dict[str, Any], spec: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """Build client data from (param_name, data_key) pairs, skipping None values"""
+    return {key: local[param] for param, key in spec if local[param] is not None}
+
+
+def _pack_nn(pairs: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """Build client data from (data_key, value) pairs, skipping None values"""
+    return {key: value for key, value in pairs if value is not None}
+
+
 # Initialize FastMCP server
 mcp = FastMCP("OpenProject MCP Server")
 
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Server settings, read from the environment once at import time"""
+    base_url: Optional[str]
+    api_key: Optional[str]
+    proxy: Optional[str]
+    test_on_startup: bool
+    response_cache_ttl: float
+    reference_cache_ttl: float
+    pool_size: int
+    pool_size_per_host: int
+    keepalive_timeout: float
+    transport: str
+    http_host: str
+    http_port: int
+
+
+_CFG = _Config(
+    base_url=os.getenv("OPENPROJECT_URL"),
+    api_key=os.getenv("OPENPROJECT_API_KEY"),
+    proxy=os.getenv("OPENPROJECT_PROXY"),
+    test_on_startup=os.getenv("TEST_CONNECTION_ON_STARTUP", "false").lower() == "true",
+    response_cache_ttl=float(os.getenv("RESPONSE_CACHE_TTL", "60")),
+    reference_cache_ttl=float(os.getenv("REFERENCE_CACHE_TTL", "300")),
+    pool_size=int(os.getenv("OPENPROJECT_POOL_SIZE", "64")),
+    pool_size_per_host=int(os.getenv("OPENPROJECT_POOL_SIZE_PER_HOST", "32")),
+    keepalive_timeout=float(os.getenv("OPENPROJECT_KEEPALIVE_TIMEOUT", "60")),
+    transport=(
+        "http"
+        if os.getenv("USE_HTTP_TRANSPORT", "true").lower() == "true"
+        else "stdio"
+    ),
+    http_host=os.getenv("HTTP_HOST", "0.0.0.0"),
+    http_port=int(os.getenv("HTTP_PORT", "8008")),
+)
+
 # Global client instance
 client: Optional[OpenProjectClient] = None
+_CLIENT_LOCK = asyncio.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0}
 
 
 async def get_client() -> OpenProjectClient:
     """Get or create OpenProject client"""
     global client
-    if client is None:
-        base_url = os.getenv("OPENPROJECT_URL")
-        api_key = os.getenv("OPENPROJECT_API_KEY")
-        proxy = os.getenv("OPENPROJECT_PROXY")
-        
-        if not base_url or not api_key:
-            raise ValueError("OPENPROJECT_URL and OPENPROJECT_API_KEY must be set")
-        
-        client = OpenProjectClient(base_url, api_key, proxy)
-        logger.info(f"✅ OpenProject Client initialized for {base_url}")
+    if client is not None:
+        _CACHE_STATS["hits"] += 1
+        return client
+    
+    async with _CLIENT_LOCK:
+        if client is None:
+            _CACHE_STATS["misses"] += 1
+            if not _CFG.base_url or not _CFG.api_key:
+                raise ValueError("OPENPROJECT_URL and OPENPROJECT_API_KEY must be set")
+            
+            new_client = OpenProjectClient(
+                _CFG.base_url,
+                _CFG.api_key,
+                _CFG.proxy,
+                pool_size=_CFG.pool_size,
+                pool_size_per_host=_CFG.pool_size_per_host,
+                keepalive_timeout=_CFG.keepalive_timeout,
+            )
+            logger.info("✅ OpenProject Client initialized for %s", _CFG.base_url)
+            
+            # Optional: Test connection on startup
+            if _CFG.test_on_startup:
+                try:
+                    _record_connection_test(await new_client.test_connection())
+                    logger.info("✅ API connection test successful!")
+                except Exception as e:
+                    logger.error("❌ API connection test failed: %s", e)
+            
+            client = new_client
+    
+    return client
+
+
+# Response cache: key -> (expires_at, formatted tool output), least
+# recently used first; keys embed filters and IDs, so the size is capped
+# to leave room for per-ID relation and project details next to listings
+_RESP_CACHE_MAXSIZE = 512
+_RESP_CACHE: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_RESP_STATS = {"hits": 0, "misses": 0}
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """Return a cached tool response, or None if missing or expired"""
+    entry = _RESP_CACHE.get(key)
+    if entry is not None:
+        if time.monotonic() < entry[0]:
+            _RESP_CACHE.move_to_end(key)
+            _RESP_STATS["hits"] += 1
+            return entry[1]
+        del _RESP_CACHE[key]
+    _RESP_STATS["misses"] += 1
+    return None
+
+
+def _cache_put(key: str, text: str, ttl: float = _CFG.response_cache_ttl) -> str:
+    """Store a tool response in the cache, evicting the oldest if full"""
+    _RESP_CACHE[key] = (time.monotonic() + ttl, text)
+    _RESP_CACHE.move_to_end(key)
+    if len(_RESP_CACHE) > _RESP_CACHE_MAXSIZE:
+        _RESP_CACHE.popitem(last=False)
+    return text
+
+
+# Renders in progress by cache key, so concurrent misses share one request
+_INFLIGHT: Dict[str, "asyncio.Task[str]"] = {}
+
+# Bumped by every invalidation; a render that spans one is not cached
+_CACHE_GENERATION = 0
+
+
+async def _cached(key: str, render, ttl: float = _CFG.response_cache_ttl) -> str:
+    """Return the cached response for key, or await render() and cache it"""
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
+    task = _INFLIGHT.get(key)
+    if task is None:
+        generation = _CACHE_GENERATION
         
-        # Optional: Test connection on startup
-        if os.getenv("TEST_CONNECTION_ON_STARTUP", "false").lower() == "true":
+        async def run() -> str:
             try:
-                await client.test_connection()
-                logger.info("✅ API connection test successful!")
-            except Exception as e:
-                logger.error(f"❌ API connection test failed: {e}")
+                text = await render()
+                # A write invalidated the cache meanwhile; text may predate it
+                if generation == _CACHE_GENERATION:
+                    _cache_put(key, text, ttl)
+                return text
+            finally:
+                if _INFLIGHT.get(key) is task:
+                    del _INFLIGHT[key]
+        
+        task = _INFLIGHT[key] = asyncio.ensure_future(run())
     
-    return client
+    # Shielded so one cancelled caller does not cancel the shared render
+    return await asyncio.shield(task)
+
+
+def _cache_invalidate(*prefixes: str) -> int:
+    """Drop cached responses whose key starts with any prefix (all if none given)"""
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+    
+    # Renders still running may hold pre-write data; new callers start fresh
+    for k in [k for k in _INFLIGHT if not prefixes or k.startswith(prefixes)]:
+        del _INFLIGHT[k]
+    
+    keys = [k for k in _RESP_CACHE if not prefixes or k.startswith(prefixes)]
+    for k in keys:
+        del _RESP_CACHE[k]
+    return len(keys)
+
+
+# Last successful connection test: (monotonic timestamp, formatted result)
+_CONNECTION_TEST_TTL = 30.0
+_LAST_TEST: Optional[Tuple[float, str]] = None
+
+
+def _record_connection_test(result: Dict) -> str:
+    """Format a successful connection test result and remember it"""
+    global _LAST_TEST
+    if result.get("instanceName"):
+        text = f"✅ Connected to: {result['instanceName']}\n" \
+               f"Core Version: {result.get('coreVersion', 'Unknown')}"
+    else:
+        text = "✅ Connection successful!"
+    _LAST_TEST = (time.monotonic(), text)
+    return text
+
+
+# Upper bound for concurrent API calls issued by a single bulk tool,
+# matching the client's per-host connection pool; writes use a lower
+# bound since each one can trigger form validation on the server
+_BULK_CONCURRENCY = _CFG.pool_size_per_host
+_BULK_WRITE_CONCURRENCY = 8
+
+
+async def _gather_limited(func, items, limit: int = _BULK_CONCURRENCY) -> list:
+    """
+    Call func(item) for every item concurrently, at most `limit` at a time
+    
+    Results are returned in input order; failures are returned as the
+    raised exception instead of aborting the whole batch.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+    
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+def _bulk_summary(label: str, verb: str, results: list, describe) -> str:
+    """Render the outcome of a bulk tool, one line per item"""
+    failed = sum(isinstance(r, Exception) for r in results)
+    icon = "✅" if not failed else "⚠️"
+    parts = [f"{icon} {label}: {len(results) - failed} {verb}, {failed} failed\n\n"]
+    for i, r in enumerate(results, 1):
+        if isinstance(r, Exception):
+            parts.append(f"❌ Item {i}: {r}\n")
+        else:
+            parts.append(f"✅ Item {i}: {describe(r)}\n")
+    return "".join(parts)
 
 
 # ============================================================================
@@ -66,59 +322,103 @@ async def get_client() -> OpenProjectClient:
 async def test_connection() -> str:
     """Test the connection to the OpenProject API"""
     try:
+        # Reuse a recent successful test instead of hitting the API again
+        if (
+            _LAST_TEST is not None
+            and time.monotonic() - _LAST_TEST[0] < _CONNECTION_TEST_TTL
+        ):
+            return _LAST_TEST[1]
+        
         c = await get_client()
         result = await c.test_connection()
-        
-        if result.get("instanceName"):
-            return f"✅ Connected to: {result['instanceName']}\n" \
-                   f"Core Version: {result.get('coreVersion', 'Unknown')}"
-        return "✅ Connection successful!"
+        return _record_connection_test(result)
     except Exception as e:
         return f"❌ Connection failed: {str(e)}"
 
 
+# ============================================================================
+# MCP Tools - Cache
+# ============================================================================
+
+@mcp.tool()
+async def invalidate_cache() -> str:
+    """Clear all cached responses so the next calls fetch fresh data"""
+    count = _cache_invalidate()
+    return f"✅ Cache cleared ({count} entries removed)"
+
+
+@mcp.tool()
+async def get_cache_stats() -> str:
+    """Get hit/miss counters and sizes of the server's caches as JSON"""
+    test_age = time.monotonic() - _LAST_TEST[0] if _LAST_TEST is not None else None
+    return _dumps({
+        "client": _CACHE_STATS,
+        "responses": {"size": len(_RESP_CACHE), **_RESP_STATS},
+        "test": {"cached": _LAST_TEST is not None, "age_s": test_age},
+    })
+
+
 # ============================================================================
 # MCP Tools - Projects
 # ============================================================================
 
 @mcp.tool()
-async def list_projects(active_only: bool = True) -> str:
+@tool_errors("listing projects")
+async def list_projects(
+    active_only: bool = True,
+    offset: Optional[int] = None,
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
+    format: OutputFormat = "md"
+) -> str:
     """
-    List all OpenProject projects
+    List OpenProject projects, one page at a time
     
     Args:
         active_only: Show only active projects (default: True)
+        offset: Page number for pagination (optional, default: 1)
+        page_size: Number of results per page (default: 25, max: 100)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
     """
-    try:
+    size = _page_size(page_size)
+    
+    async def render() -> str:
         c = await get_client()
         
-        # Build filters for active_only
-        filters = None
-        if active_only:
-            filters = json.dumps([{"active": {"operator": "=", "values": ["t"]}}])
-        
-        result = await c.get_projects(filters=filters)
+        filters = _ACTIVE_ONLY_FILTER if active_only else None
+        result = await c.get_projects(
+            filters=filters, offset=offset, page_size=size
+        )
+        if format == "json":
+            return _dumps(result)
         
         projects = result.get("_embedded", {}).get("elements", [])
         
         if not projects:
             return "No projects found."
         
-        text = f"📋 Projects ({len(projects)} found):\n\n"
+        parts = [
+            f"{_PROJ_ICON} Projects ({_page_info(len(projects), result, offset)}):\n\n"
+        ]
+        append = parts.append
         for project in projects:
-            status = "🟢" if project.get("active", False) else "🔴"
-            text += f"{status} **{project['name']}** (ID: {project['id']})\n"
-            if project.get("description", {}).get("raw"):
-                desc = project["description"]["raw"][:100]
-                text += f"   {desc}{'...' if len(project['description']['raw']) > 100 else ''}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error listing projects: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+            _get = project.get
+            status = _ACTIVE if _get("active") else _ARCHIVED
+            append(f"{status} **{project['name']}** (ID: {project['id']})\n")
+            desc_field = _get("description")
+            desc = desc_field.get("raw") if desc_field else None
+            if desc:
+                append(f"   {desc[:100]}{'...' if len(desc) > 100 else ''}\n")
+        
+        return "".join(parts)
+    
+    return await _cached(
+        f"projects:list:{active_only}:{offset}:{size}:{format}", render
+    )
 
 
 @mcp.tool()
+@tool_errors("getting project")
 async def get_project(project_id: int) -> str:
     """
     Get detailed information about a specific project
@@ -126,26 +426,59 @@ async def get_project(project_id: int) -> str:
     Args:
         project_id: The project ID
     """
-    try:
+    async def render() -> str:
         c = await get_client()
         project = await c.get_project(project_id)
+        status = (
+            f"{_ACTIVE} Active" if project.get("active") else f"{_ARCHIVED} Archived"
+        )
         
-        text = f"📋 **{project['name']}**\n\n"
-        text += f"- **ID**: {project['id']}\n"
-        text += f"- **Identifier**: {project.get('identifier', 'N/A')}\n"
-        text += f"- **Status**: {'🟢 Active' if project.get('active', False) else '🔴 Archived'}\n"
-        text += f"- **Public**: {'Yes' if project.get('public', False) else 'No'}\n"
+        parts = [
+            f"{_PROJ_ICON} **{project['name']}**\n\n",
+            f"- **ID**: {project['id']}\n",
+            f"- **Identifier**: {project.get('identifier', 'N/A')}\n",
+            f"- **Status**: {status}\n",
+            f"- **Public**: {'Yes' if project.get('public', False) else 'No'}\n",
+        ]
         
-        if project.get("description", {}).get("raw"):
-            text += f"\n**Description**:\n{project['description']['raw']}\n"
+        desc_field = project.get("description")
+        desc = desc_field.get("raw") if desc_field else None
+        if desc:
+            parts.append(f"\n**Description**:\n{desc}\n")
         
-        return text
-    except Exception as e:
-        logger.error(f"Error getting project: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        return "".join(parts)
+    
+    return await _cached(f"projects:{project_id}:", render)
 
 
 @mcp.tool()
+@tool_errors("getting projects")
+async def get_projects_bulk(project_ids: list[int]) -> str:
+    """
+    Get several projects at once, fetching them concurrently
+    
+    Args:
+        project_ids: List of project IDs
+    """
+    if not project_ids:
+        return "No project IDs provided."
+    
+    c = await get_client()
+    results = await _gather_limited(c.get_project, project_ids)
+    
+    parts = [f"{_PROJ_ICON} Projects ({len(project_ids)} requested):\n\n"]
+    for project_id, project in zip(project_ids, results):
+        if isinstance(project, Exception):
+            parts.append(f"❌ #{project_id}: {project}\n")
+            continue
+        status = _ACTIVE if project.get("active") else _ARCHIVED
+        parts.append(f"{status} **{project['name']}** (ID: {project['id']})\n")
+    
+    return "".join(parts)
+
+
+@mcp.tool()
+@tool_errors("creating project")
 async def create_project(
     name: str,
     identifier: str,
@@ -165,37 +498,63 @@ async def create_project(
         status: Project status (optional)
         parent_id: Parent project ID (optional)
     """
-    try:
-        c = await get_client()
-        data = {
-            "name": name,
-            "identifier": identifier,
-            "public": public
-        }
-        if description:
-            data["description"] = description
-        if status:
-            data["status"] = status
-        if parent_id:
-            data["parent_id"] = parent_id
-        
-        project = await c.create_project(data)
-        return f"✅ Project created: **{project['name']}** (ID: {project['id']})"
-    except Exception as e:
-        logger.error(f"Error creating project: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    data = _pack_nn((
+        ("name", name),
+        ("identifier", identifier),
+        ("public", public),
+        ("description", description),
+        ("status", status),
+        ("parent_id", parent_id),
+    ))
+    
+    project = await c.create_project(data)
+    _cache_invalidate("projects:list:")
+    return f"✅ Project created: **{project['name']}** (ID: {project['id']})"
 
 
 # ============================================================================
 # MCP Tools - Work Packages
 # ============================================================================
 
+def _render_work_package_rows(
+    parts: List[str], work_packages: List[Dict[str, Any]]
+) -> None:
+    """Append one Markdown entry per work package to parts"""
+    append = parts.append
+    for wp in work_packages:
+        try:
+            emb = _get_emb(wp) or _EMPTY
+        except KeyError:
+            emb = _EMPTY
+        try:
+            status_name = emb["status"]["name"]
+        except (KeyError, TypeError):
+            status_name = "Unknown"
+        try:
+            type_name = emb["type"]["name"]
+        except (KeyError, TypeError):
+            type_name = "N/A"
+        asg = emb.get("assignee")
+        
+        append(f"#{wp['id']} - **{wp['subject']}**\n")
+        append(f"   Status: {status_name}\n")
+        append(f"   Type: {type_name}\n")
+        
+        if asg:
+            append(f"   Assignee: {asg.get('name', 'N/A')}\n")
+        
+        append("\n")
+
+
 @mcp.tool()
+@tool_errors("listing work packages")
 async def list_work_packages(
     project_id: Optional[int] = None,
     status: str = "open",
     offset: Optional[int] = None,
-    page_size: Optional[int] = None
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
+    format: OutputFormat = "md"
 ) -> str:
     """
     List work packages with optional filtering
@@ -203,59 +562,99 @@ async def list_work_packages(
     Args:
         project_id: Filter by project ID (optional)
         status: Status filter - "open", "closed", or "all" (default: "open")
-        offset: Starting index for pagination (optional)
-        page_size: Number of results per page (optional, max: 100)
+        offset: Page number for pagination (optional, default: 1)
+        page_size: Number of results per page (default: 25, max: 100)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
     """
-    try:
-        c = await get_client()
-        
-        # Build filters based on status
-        import json
-        filters = []
-        if status == "open":
-            filters.append({"status": {"operator": "o", "values": []}})
-        elif status == "closed":
-            filters.append({"status": {"operator": "c", "values": []}})
-        # "all" means no status filter
-        
-        filters_str = json.dumps(filters) if filters else None
-        
-        result = await c.get_work_packages(
+    c = await get_client()
+    
+    # "all" (or any unknown value) means no status filter
+    filters_str = _STATUS_FILTERS.get(status)
+    
+    result = await c.get_work_packages(
+        project_id=project_id,
+        filters=filters_str,
+        offset=offset,
+        page_size=_page_size(page_size)
+    )
+    if format == "json":
+        return _dumps(result)
+    
+    work_packages = result.get("_embedded", {}).get("elements", [])
+    
+    if not work_packages:
+        return "No work packages found."
+    
+    page = _page_info(len(work_packages), result, offset)
+    parts = [f"📝 Work Packages ({page}):\n\n"]
+    _render_work_package_rows(parts, work_packages)
+    return "".join(parts)
+
+
+# Concurrent page fetches issued by list_all_work_packages
+_PREFETCH_CONCURRENCY = 4
+
+
+@mcp.tool()
+@tool_errors("listing all work packages")
+async def list_all_work_packages(
+    project_id: Optional[int] = None,
+    status: str = "open",
+    max_items: int = 1000,
+    format: OutputFormat = "md"
+) -> str:
+    """
+    List work packages across all result pages, fetching the pages concurrently
+    
+    Args:
+        project_id: Filter by project ID (optional)
+        status: Status filter - "open", "closed", or "all" (default: "open")
+        max_items: Maximum number of work packages to return (default: 1000)
+        format: "md" for formatted Markdown (default) or "json" for the
+            collected elements, for programmatic consumers
+    """
+    c = await get_client()
+    filters_str = _STATUS_FILTERS.get(status)
+    max_items = max(1, max_items)
+    page_size = min(max_items, _MAX_PAGE_SIZE)
+    
+    async def fetch(page: int) -> Dict[str, Any]:
+        return await c.get_work_packages(
             project_id=project_id,
             filters=filters_str,
-            offset=offset,
+            offset=page,
             page_size=page_size
         )
-        
-        work_packages = result.get("_embedded", {}).get("elements", [])
-        
-        if not work_packages:
-            return "No work packages found."
-        
-        total = result.get("total", len(work_packages))
-        text = f"📝 Work Packages ({len(work_packages)} of {total}):\n\n"
-        
-        for wp in work_packages:
-            status_name = wp.get("_embedded", {}).get("status", {}).get("name", "Unknown")
-            text += f"#{wp['id']} - **{wp['subject']}**\n"
-            text += f"   Status: {status_name}\n"
-            
-            wp_type = wp.get("_embedded", {}).get("type", {}).get("name", "N/A")
-            text += f"   Type: {wp_type}\n"
-            
-            if wp.get("_embedded", {}).get("assignee"):
-                assignee = wp["_embedded"]["assignee"].get("name", "N/A")
-                text += f"   Assignee: {assignee}\n"
-            
-            text += "\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error listing work packages: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    
+    # The first page reports the total, the rest are fetched in parallel
+    first = await fetch(1)
+    total = first.get("total", 0)
+    pages = math.ceil(min(total, max_items) / page_size)
+    rest = await _gather_limited(fetch, range(2, pages + 1), _PREFETCH_CONCURRENCY)
+    for result in rest:
+        if isinstance(result, Exception):
+            raise result
+    
+    work_packages = [
+        wp for result in (first, *rest) for wp in result["_embedded"]["elements"]
+    ][:max_items]
+    
+    if format == "json":
+        return _dumps(
+            {"total": total, "count": len(work_packages), "elements": work_packages}
+        )
+    
+    if not work_packages:
+        return "No work packages found."
+    
+    parts = [f"📝 Work Packages ({len(work_packages)} of {total}):\n\n"]
+    _render_work_package_rows(parts, work_packages)
+    return "".join(parts)
 
 
 @mcp.tool()
+@tool_errors("getting work package")
 async def view_work_package(work_package_id: int, timestamps: Optional[str] = None) -> str:
     """
     View detailed information about a specific work package
@@ -264,62 +663,90 @@ async def view_work_package(work_package_id: int, timestamps: Optional[str] = No
         work_package_id: The work package ID
         timestamps: Optional baseline comparison timestamps (comma-separated)
     """
-    try:
-        c = await get_client()
-        wp = await c.get_work_package(work_package_id, timestamps=timestamps)
-        
-        text = f"📝 #{wp['id']} - **{wp['subject']}**\n\n"
-        
-        status = wp.get("_embedded", {}).get("status", {}).get("name", "Unknown")
-        text += f"- **Status**: {status}\n"
-        
-        wp_type = wp.get("_embedded", {}).get("type", {}).get("name", "N/A")
-        text += f"- **Type**: {wp_type}\n"
-        
-        if wp.get("_embedded", {}).get("priority"):
-            priority = wp["_embedded"]["priority"].get("name", "N/A")
-            text += f"- **Priority**: {priority}\n"
-        
-        if wp.get("_embedded", {}).get("assignee"):
-            assignee = wp["_embedded"]["assignee"].get("name", "Unassigned")
-            text += f"- **Assignee**: {assignee}\n"
-        
-        if wp.get("_embedded", {}).get("project"):
-            project = wp["_embedded"]["project"].get("name", "N/A")
-            text += f"- **Project**: {project}\n"
-        
-        if wp.get("_embedded", {}).get("version"):
-            version = wp["_embedded"]["version"].get("name", "N/A")
-            text += f"- **Version**: {version}\n"
-        
-        if wp.get("percentageDone") is not None:
-            text += f"- **Progress**: {wp['percentageDone']}%\n"
-        
-        if wp.get("startDate"):
-            text += f"- **Start Date**: {wp['startDate']}\n"
-        
-        if wp.get("dueDate"):
-            text += f"- **Due Date**: {wp['dueDate']}\n"
-        
-        if wp.get("date"):
-            text += f"- **Date**: {wp['date']}\n"
-        
-        if wp.get("createdAt"):
-            text += f"- **Created**: {wp['createdAt']}\n"
-        
-        if wp.get("updatedAt"):
-            text += f"- **Updated**: {wp['updatedAt']}\n"
-        
-        if wp.get("description", {}).get("raw"):
-            text += f"\n**Description**:\n{wp['description']['raw']}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error getting work package: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    wp = await c.get_work_package(work_package_id, timestamps=timestamps)
+    
+    parts = [f"📝 #{wp['id']} - **{wp['subject']}**\n\n"]
+    
+    emb = wp.get("_embedded") or _EMPTY
+    
+    status = (emb.get("status") or _EMPTY).get("name", "Unknown")
+    parts.append(f"- **Status**: {status}\n")
+    
+    wp_type = (emb.get("type") or _EMPTY).get("name", "N/A")
+    parts.append(f"- **Type**: {wp_type}\n")
+    
+    priority = emb.get("priority")
+    if priority:
+        parts.append(f"- **Priority**: {priority.get('name', 'N/A')}\n")
+    
+    assignee = emb.get("assignee")
+    if assignee:
+        parts.append(f"- **Assignee**: {assignee.get('name', 'Unassigned')}\n")
+    
+    project = emb.get("project")
+    if project:
+        parts.append(f"- **Project**: {project.get('name', 'N/A')}\n")
+    
+    version = emb.get("version")
+    if version:
+        parts.append(f"- **Version**: {version.get('name', 'N/A')}\n")
+    
+    if wp.get("percentageDone") is not None:
+        parts.append(f"- **Progress**: {wp['percentageDone']}%\n")
+    
+    if wp.get("startDate"):
+        parts.append(f"- **Start Date**: {wp['startDate']}\n")
+    
+    if wp.get("dueDate"):
+        parts.append(f"- **Due Date**: {wp['dueDate']}\n")
+    
+    if wp.get("date"):
+        parts.append(f"- **Date**: {wp['date']}\n")
+    
+    if wp.get("createdAt"):
+        parts.append(f"- **Created**: {wp['createdAt']}\n")
+    
+    if wp.get("updatedAt"):
+        parts.append(f"- **Updated**: {wp['updatedAt']}\n")
+    
+    if wp.get("description", {}).get("raw"):
+        parts.append(f"\n**Description**:\n{wp['description']['raw']}\n")
+    
+    return "".join(parts)
+
+
+def _work_package_data(
+    project_id: int,
+    subject: str,
+    type_id: int,
+    description: Optional[str] = None,
+    priority_id: Optional[int] = None,
+    assignee_id: Optional[int] = None,
+    version_id: Optional[int] = None,
+    start_date: Optional[str] = None,
+    due_date: Optional[str] = None,
+    date: Optional[str] = None
+) -> Dict[str, Any]:
+    """Translate create_work_package arguments into client data"""
+    # OpenProjectClient expects 'project' and 'type' keys, not 'project_id'
+    # and 'type_id'
+    return _pack_nn((
+        ("project", project_id),
+        ("subject", subject),
+        ("type", type_id),
+        ("description", description),
+        ("priority_id", priority_id),
+        ("assignee_id", assignee_id),
+        ("version_id", version_id),
+        ("startDate", start_date),
+        ("dueDate", due_date),
+        ("date", date),
+    ))
 
 
 @mcp.tool()
+@tool_errors("creating work package")
 async def create_work_package(
     project_id: int,
     subject: str,
@@ -347,37 +774,59 @@ async def create_work_package(
         due_date: Due date in YYYY-MM-DD format (optional)
         date: Date in YYYY-MM-DD format (optional)
     """
-    try:
-        c = await get_client()
-        # OpenProjectClient expects 'project' and 'type' keys, not 'project_id' and 'type_id'
-        data = {
-            "project": project_id,
-            "subject": subject,
-            "type": type_id
-        }
-        if description:
-            data["description"] = description
-        if priority_id:
-            data["priority_id"] = priority_id
-        if assignee_id:
-            data["assignee_id"] = assignee_id
-        if version_id:
-            data["version_id"] = version_id
-        if start_date:
-            data["startDate"] = start_date
-        if due_date:
-            data["dueDate"] = due_date
-        if date:
-            data["date"] = date
-        
-        wp = await c.create_work_package(data)
-        return f"✅ Work package created: #{wp['id']} - **{wp['subject']}**"
-    except Exception as e:
-        logger.error(f"Error creating work package: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    data = _work_package_data(
+        project_id, subject, type_id, description, priority_id,
+        assignee_id, version_id, start_date, due_date, date
+    )
+    
+    wp = await c.create_work_package(data)
+    return f"✅ Work package created: #{wp['id']} - **{wp['subject']}**"
+
+
+@mcp.tool()
+@tool_errors("creating work packages")
+async def create_work_packages_bulk(project_id: int, items: list[dict]) -> str:
+    """
+    Create several work packages in a project concurrently
+    
+    Args:
+        project_id: The project ID
+        items: Work packages to create; each item takes the create_work_package
+            arguments except project_id (subject and type_id are required)
+    """
+    if not items:
+        return "No work packages provided."
+    
+    c = await get_client()
+    
+    async def create(item: dict) -> Dict:
+        return await c.create_work_package(_work_package_data(project_id, **item))
+    
+    results = await _gather_limited(create, items, _BULK_WRITE_CONCURRENCY)
+    return _bulk_summary(
+        "Work packages", "created", results,
+        lambda wp: f"#{wp['id']} - **{wp['subject']}**"
+    )
+
+
+_WP_UPDATE_FIELDS = (
+    ("subject", "subject"),
+    ("description", "description"),
+    ("type_id", "type_id"),
+    ("status_id", "status_id"),
+    ("priority_id", "priority_id"),
+    ("assignee_id", "assignee_id"),
+    ("percentage_done", "percentage_done"),
+    ("version_id", "version_id"),
+    ("start_date", "startDate"),
+    ("due_date", "dueDate"),
+    ("date", "date"),
+)
 
 
 @mcp.tool()
+@tool_errors("updating work package")
 async def update_work_package(
     work_package_id: int,
     subject: Optional[str] = None,
@@ -409,40 +858,15 @@ async def update_work_package(
         due_date: Due date in YYYY-MM-DD format (optional)
         date: Date in YYYY-MM-DD format (optional)
     """
-    try:
-        c = await get_client()
-        data = {}
-        if subject is not None:
-            data["subject"] = subject
-        if description is not None:
-            data["description"] = description
-        if type_id is not None:
-            data["type_id"] = type_id
-        if status_id is not None:
-            data["status_id"] = status_id
-        if priority_id is not None:
-            data["priority_id"] = priority_id
-        if assignee_id is not None:
-            data["assignee_id"] = assignee_id
-        if percentage_done is not None:
-            data["percentage_done"] = percentage_done
-        if version_id is not None:
-            data["version_id"] = version_id
-        if start_date is not None:
-            data["startDate"] = start_date
-        if due_date is not None:
-            data["dueDate"] = due_date
-        if date is not None:
-            data["date"] = date
-        
-        wp = await c.update_work_package(work_package_id, data)
-        return f"✅ Work package updated: #{wp['id']} - **{wp['subject']}**"
-    except Exception as e:
-        logger.error(f"Error updating work package: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    data = _pack(locals(), _WP_UPDATE_FIELDS)
+    c = await get_client()
+    
+    wp = await c.update_work_package(work_package_id, data)
+    return f"✅ Work package updated: #{wp['id']} - **{wp['subject']}**"
 
 
 @mcp.tool()
+@tool_errors("deleting work package")
 async def delete_work_package(work_package_id: int) -> str:
     """
     Delete a work package
@@ -450,13 +874,9 @@ async def delete_work_package(work_package_id: int) -> str:
     Args:
         work_package_id: The work package ID
     """
-    try:
-        c = await get_client()
-        await c.delete_work_package(work_package_id)
-        return f"✅ Work package #{work_package_id} deleted successfully"
-    except Exception as e:
-        logger.error(f"Error deleting work package: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    await c.delete_work_package(work_package_id)
+    return f"✅ Work package #{work_package_id} deleted successfully"
 
 
 # ============================================================================
@@ -464,57 +884,59 @@ async def delete_work_package(work_package_id: int) -> str:
 # ============================================================================
 
 @mcp.tool()
+@tool_errors("listing documents")
 async def list_documents(
     offset: Optional[int] = None,
-    page_size: Optional[int] = None,
-    sort_by: Optional[str] = None
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
+    sort_by: Optional[str] = None,
+    format: OutputFormat = "md"
 ) -> str:
     """
     List documents with optional pagination and sorting
     
     Args:
-        offset: Page number inside the requested collection (optional)
-        page_size: Number of elements to display per page (optional)
+        offset: Page number for pagination (optional, default: 1)
+        page_size: Number of results per page (default: 25, max: 100)
         sort_by: JSON sort criteria (e.g. [["created_at", "asc"]]) (optional)
-    """
-    try:
-        c = await get_client()
-        result = await c.get_documents(
-            offset=offset,
-            page_size=page_size,
-            sort_by=sort_by
-        )
-        
-        documents = result.get("_embedded", {}).get("elements", [])
-        
-        if not documents:
-            return "No documents found."
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    """
+    c = await get_client()
+    result = await c.get_documents(
+        offset=offset,
+        page_size=_page_size(page_size),
+        sort_by=sort_by
+    )
+    if format == "json":
+        return _dumps(result)
+    
+    documents = result.get("_embedded", {}).get("elements", [])
+    
+    if not documents:
+        return "No documents found."
+    
+    parts = [f"📄 Documents ({_page_info(len(documents), result, offset)}):\n\n"]
+    
+    for doc in documents:
+        parts.append(f"#{doc['id']} - **{doc.get('title', 'Untitled')}**\n")
         
-        total = result.get("total", len(documents))
-        text = f"📄 Documents ({len(documents)} of {total}):\n\n"
+        if doc.get("description"):
+            # Truncate long descriptions
+            desc = doc['description']
+            if len(desc) > 100:
+                desc = desc[:100] + "..."
+            parts.append(f"   {desc}\n")
         
-        for doc in documents:
-            text += f"#{doc['id']} - **{doc.get('title', 'Untitled')}**\n"
-            
-            if doc.get("description"):
-                # Truncate long descriptions
-                desc = doc['description']
-                if len(desc) > 100:
-                    desc = desc[:100] + "..."
-                text += f"   {desc}\n"
-            
-            if doc.get("createdAt"):
-                text += f"   Created: {doc['createdAt']}\n"
-            
-            text += "\n"
+        if doc.get("createdAt"):
+            parts.append(f"   Created: {doc['createdAt']}\n")
         
-        return text
-    except Exception as e:
-        logger.error(f"Error listing documents: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        parts.append("\n")
+    
+    return "".join(parts)
 
 
 @mcp.tool()
+@tool_errors("getting document")
 async def get_document(document_id: int) -> str:
     """
     Get detailed information about a specific document
@@ -522,31 +944,30 @@ async def get_document(document_id: int) -> str:
     Args:
         document_id: The document ID
     """
-    try:
-        c = await get_client()
-        doc = await c.get_document(document_id)
-        
-        text = f"📄 Document #{doc['id']}\n\n"
-        text += f"- **Title**: {doc.get('title', 'Untitled')}\n"
-        
-        if doc.get("description"):
-            text += f"- **Description**: {doc['description']}\n"
-        
-        if doc.get("createdAt"):
-            text += f"- **Created**: {doc['createdAt']}\n"
-        
-        if doc.get("updatedAt"):
-            text += f"- **Updated**: {doc['updatedAt']}\n"
-        
-        # Include project information if available
-        project = doc.get("_embedded", {}).get("project", {})
-        if project:
-            text += f"- **Project**: {project.get('name', 'N/A')} (ID: {project.get('id', 'N/A')})\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error getting document: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    doc = await c.get_document(document_id)
+    
+    parts = [f"📄 Document #{doc['id']}\n\n"]
+    parts.append(f"- **Title**: {doc.get('title', 'Untitled')}\n")
+    
+    if doc.get("description"):
+        parts.append(f"- **Description**: {doc['description']}\n")
+    
+    if doc.get("createdAt"):
+        parts.append(f"- **Created**: {doc['createdAt']}\n")
+    
+    if doc.get("updatedAt"):
+        parts.append(f"- **Updated**: {doc['updatedAt']}\n")
+    
+    # Include project information if available
+    project = doc.get("_embedded", {}).get("project", {})
+    if project:
+        parts.append(
+            f"- **Project**: {project.get('name', 'N/A')} "
+            f"(ID: {project.get('id', 'N/A')})\n"
+        )
+    
+    return "".join(parts)
 
 
 # ============================================================================
@@ -554,70 +975,86 @@ async def get_document(document_id: int) -> str:
 # ============================================================================
 
 @mcp.tool()
-async def list_types(project_id: Optional[int] = None) -> str:
+@tool_errors("listing types")
+async def list_types(
+    project_id: Optional[int] = None, format: OutputFormat = "md"
+) -> str:
     """
     List available work package types
     
     Args:
         project_id: Filter types by project (optional)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
     """
-    try:
+    async def render() -> str:
         c = await get_client()
         result = await c.get_types(project_id=project_id)
+        if format == "json":
+            return _dumps(result)
         
         types = result.get("_embedded", {}).get("elements", [])
         
         if not types:
             return "No types found."
         
-        text = f"🏷️  Work Package Types ({len(types)}):\n\n"
+        parts = [f"🏷️  Work Package Types ({len(types)}):\n\n"]
         for t in types:
-            text += f"- **{t['name']}** (ID: {t['id']})\n"
+            parts.append(f"- **{t['name']}** (ID: {t['id']})\n")
         
-        return text
-    except Exception as e:
-        logger.error(f"Error listing types: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        return "".join(parts)
+    
+    return await _cached(
+        f"types:{project_id}:{format}", render, _CFG.reference_cache_ttl
+    )
 
 
 # Add remaining tools following the same pattern...
 # For brevity, I'll add a few more key ones
 
 @mcp.tool()
-async def list_users(active_only: bool = True) -> str:
+@tool_errors("listing users")
+async def list_users(
+    active_only: bool = True,
+    offset: Optional[int] = None,
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
+    format: OutputFormat = "md"
+) -> str:
     """
-    List all users in the OpenProject instance
+    List users in the OpenProject instance, one page at a time
     
     Args:
         active_only: Show only active users (default: True)
-    """
-    try:
-        c = await get_client()
-        import json
-        filters = None
-        if active_only:
-            filters = json.dumps([{"status": {"operator": "=", "values": ["active"]}}])
-        result = await c.get_users(filters=filters)
-        
-        users = result.get("_embedded", {}).get("elements", [])
-        
-        if not users:
-            return "No users found."
-        
-        text = f"👥 Users ({len(users)} found):\n\n"
-        for user in users:
-            status = "🟢" if user.get("status") == "active" else "🔴"
-            text += f"{status} **{user.get('name', 'N/A')}** (ID: {user['id']})\n"
-            if user.get("email"):
-                text += f"   📧 {user['email']}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error listing users: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        offset: Page number for pagination (optional, default: 1)
+        page_size: Number of results per page (default: 25, max: 100)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    """
+    c = await get_client()
+    filters = _ACTIVE_USER_FILTER if active_only else None
+    result = await c.get_users(
+        filters=filters, offset=offset, page_size=_page_size(page_size)
+    )
+    if format == "json":
+        return _dumps(result)
+    
+    users = result.get("_embedded", {}).get("elements", [])
+    
+    if not users:
+        return "No users found."
+    
+    parts = [f"👥 Users ({_page_info(len(users), result, offset)}):\n\n"]
+    for user in users:
+        status = "🟢" if user.get("status") == "active" else "🔴"
+        parts.append(f"{status} **{user.get('name', 'N/A')}** (ID: {user['id']})\n")
+        if user.get("email"):
+            parts.append(f"   📧 {user['email']}\n")
+    
+    return "".join(parts)
 
 
 @mcp.tool()
+@tool_errors("getting user")
 async def get_user(user_id: int) -> str:
     """
     Get detailed information about a specific user
@@ -625,69 +1062,92 @@ async def get_user(user_id: int) -> str:
     Args:
         user_id: The user ID
     """
-    try:
-        c = await get_client()
-        user = await c.get_user(user_id)
-        
-        text = f"👤 **{user.get('name', 'N/A')}**\n\n"
-        text += f"- **ID**: {user['id']}\n"
-        text += f"- **Status**: {user.get('status', 'N/A')}\n"
-        if user.get("email"):
-            text += f"- **Email**: {user['email']}\n"
-        if user.get("login"):
-            text += f"- **Login**: {user['login']}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error getting user: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    user = await c.get_user(user_id)
+    
+    parts = [f"👤 **{user.get('name', 'N/A')}**\n\n"]
+    parts.append(f"- **ID**: {user['id']}\n")
+    parts.append(f"- **Status**: {user.get('status', 'N/A')}\n")
+    if user.get("email"):
+        parts.append(f"- **Email**: {user['email']}\n")
+    if user.get("login"):
+        parts.append(f"- **Login**: {user['login']}\n")
+    
+    return "".join(parts)
 
 
 @mcp.tool()
-async def list_statuses() -> str:
-    """List all available work package statuses"""
-    try:
+@tool_errors("listing statuses")
+async def list_statuses(format: OutputFormat = "md") -> str:
+    """
+    List all available work package statuses
+    
+    Args:
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    """
+    async def render() -> str:
         c = await get_client()
         result = await c.get_statuses()
+        if format == "json":
+            return _dumps(result)
         
         statuses = result.get("_embedded", {}).get("elements", [])
         
         if not statuses:
             return "No statuses found."
         
-        text = f"📊 Work Package Statuses ({len(statuses)}):\n\n"
+        parts = [f"📊 Work Package Statuses ({len(statuses)}):\n\n"]
         for s in statuses:
-            text += f"- **{s['name']}** (ID: {s['id']})\n"
+            parts.append(f"- **{s['name']}** (ID: {s['id']})\n")
         
-        return text
-    except Exception as e:
-        logger.error(f"Error listing statuses: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        return "".join(parts)
+    
+    return await _cached(f"statuses:{format}", render, _CFG.reference_cache_ttl)
 
 
 @mcp.tool()
-async def list_priorities() -> str:
-    """List all available work package priorities"""
-    try:
+@tool_errors("listing priorities")
+async def list_priorities(format: OutputFormat = "md") -> str:
+    """
+    List all available work package priorities
+    
+    Args:
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    """
+    async def render() -> str:
         c = await get_client()
         result = await c.get_priorities()
+        if format == "json":
+            return _dumps(result)
         
         priorities = result.get("_embedded", {}).get("elements", [])
         
         if not priorities:
             return "No priorities found."
         
-        text = f"⭐ Work Package Priorities ({len(priorities)}):\n\n"
+        parts = [f"⭐ Work Package Priorities ({len(priorities)}):\n\n"]
         for p in priorities:
-            text += f"- **{p['name']}** (ID: {p['id']})\n"
+            parts.append(f"- **{p['name']}** (ID: {p['id']})\n")
         
-        return text
-    except Exception as e:
-        logger.error(f"Error listing priorities: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        return "".join(parts)
+    
+    return await _cached(f"priorities:{format}", render, _CFG.reference_cache_ttl)
+
+
+_PROJECT_UPDATE_FIELDS = (
+    ("name", "name"),
+    ("identifier", "identifier"),
+    ("description", "description"),
+    ("public", "public"),
+    ("status", "status"),
+    ("parent_id", "parent_id"),
+)
 
 
 @mcp.tool()
+@tool_errors("updating project")
 async def update_project(
     project_id: int,
     name: Optional[str] = None,
@@ -708,31 +1168,18 @@ async def update_project(
         public: Whether the project is public (optional)
         status: Project status (optional)
         parent_id: Parent project ID (optional)
-    """
-    try:
-        c = await get_client()
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if identifier is not None:
-            data["identifier"] = identifier
-        if description is not None:
-            data["description"] = description
-        if public is not None:
-            data["public"] = public
-        if status is not None:
-            data["status"] = status
-        if parent_id is not None:
-            data["parent_id"] = parent_id
-        
-        project = await c.update_project(project_id, data)
-        return f"✅ Project updated: **{project['name']}** (ID: {project['id']})"
-    except Exception as e:
-        logger.error(f"Error updating project: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    """
+    data = _pack(locals(), _PROJECT_UPDATE_FIELDS)
+    c = await get_client()
+    
+    project = await c.update_project(project_id, data)
+    _cache_invalidate("projects:list:")
+    _cache_invalidate(f"projects:{project_id}:")
+    return f"✅ Project updated: **{project['name']}** (ID: {project['id']})"
 
 
 @mcp.tool()
+@tool_errors("deleting project")
 async def delete_project(project_id: int) -> str:
     """
     Delete a project
@@ -740,19 +1187,21 @@ async def delete_project(project_id: int) -> str:
     Args:
         project_id: The project ID
     """
-    try:
-        c = await get_client()
-        await c.delete_project(project_id)
-        return f"✅ Project #{project_id} deleted successfully"
-    except Exception as e:
-        logger.error(f"Error deleting project: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    await c.delete_project(project_id)
+    _cache_invalidate("projects:list:")
+    _cache_invalidate(f"projects:{project_id}:")
+    return f"✅ Project #{project_id} deleted successfully"
 
 
 @mcp.tool()
+@tool_errors("listing memberships")
 async def list_memberships(
     project_id: Optional[int] = None,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    offset: Optional[int] = None,
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
+    format: OutputFormat = "md"
 ) -> str:
     """
     List project memberships
@@ -760,32 +1209,71 @@ async def list_memberships(
     Args:
         project_id: Filter by specific project (optional)
         user_id: Filter by specific user (optional)
-    """
-    try:
-        c = await get_client()
-        result = await c.get_memberships(project_id=project_id, user_id=user_id)
-        
-        memberships = result.get("_embedded", {}).get("elements", [])
-        
-        if not memberships:
-            return "No memberships found."
-        
-        text = f"👥 Memberships ({len(memberships)} found):\n\n"
-        for m in memberships:
-            principal = m.get("_embedded", {}).get("principal", {})
-            project = m.get("_embedded", {}).get("project", {})
-            roles = m.get("_embedded", {}).get("roles", [])
-            
-            text += f"- **{principal.get('name', 'N/A')}** in **{project.get('name', 'N/A')}**\n"
-            text += f"  Roles: {', '.join([r.get('name', 'N/A') for r in roles])}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error listing memberships: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        offset: Page number for pagination (optional, default: 1)
+        page_size: Number of results per page (default: 25, max: 100)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    """
+    c = await get_client()
+    result = await c.get_memberships(
+        project_id=project_id,
+        user_id=user_id,
+        offset=offset,
+        page_size=_page_size(page_size)
+    )
+    if format == "json":
+        return _dumps(result)
+    
+    memberships = result.get("_embedded", {}).get("elements", [])
+    
+    if not memberships:
+        return "No memberships found."
+    
+    parts = [f"👥 Memberships ({_page_info(len(memberships), result, offset)}):\n\n"]
+    for m in memberships:
+        try:
+            emb = _get_emb(m) or _EMPTY
+        except KeyError:
+            emb = _EMPTY
+        try:
+            principal_name = emb["principal"]["name"]
+        except (KeyError, TypeError):
+            principal_name = "N/A"
+        try:
+            project_name = emb["project"]["name"]
+        except (KeyError, TypeError):
+            project_name = "N/A"
+        roles = emb.get("roles") or ()
+        
+        parts.append(f"- **{principal_name}** in **{project_name}**\n")
+        parts.append(f"  Roles: {', '.join(r.get('name', 'N/A') for r in roles)}\n")
+    
+    return "".join(parts)
+
+
+def _membership_data(
+    project_id: int,
+    user_id: Optional[int] = None,
+    group_id: Optional[int] = None,
+    role_ids: Optional[list[int]] = None,
+    role_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Translate create_membership arguments into client data"""
+    if not user_id and not group_id:
+        raise ValueError("Either user_id or group_id must be provided")
+    
+    # A user takes precedence over a group, a role list over a single role
+    return _pack_nn((
+        ("project_id", project_id),
+        ("user_id", user_id or None),
+        ("group_id", None if user_id else group_id),
+        ("role_ids", role_ids or None),
+        ("role_id", None if role_ids else role_id),
+    ))
 
 
 @mcp.tool()
+@tool_errors("creating membership")
 async def create_membership(
     project_id: int,
     user_id: Optional[int] = None,
@@ -804,28 +1292,43 @@ async def create_membership(
         role_id: Single role ID (optional, alternative to role_ids)
     """
     try:
-        c = await get_client()
-        data = {"project_id": project_id}
-        if user_id:
-            data["user_id"] = user_id
-        elif group_id:
-            data["group_id"] = group_id
-        else:
-            return "❌ Error: Either user_id or group_id must be provided"
-        
-        if role_ids:
-            data["role_ids"] = role_ids
-        elif role_id:
-            data["role_id"] = role_id
-        
-        await c.create_membership(data)
-        return f"✅ Membership created successfully"
-    except Exception as e:
-        logger.error(f"Error creating membership: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        data = _membership_data(project_id, user_id, group_id, role_ids, role_id)
+    except ValueError as e:
+        return f"❌ Error: {e}"
+    
+    c = await get_client()
+    await c.create_membership(data)
+    return f"✅ Membership created successfully"
+
+
+@mcp.tool()
+@tool_errors("creating memberships")
+async def create_memberships_bulk(project_id: int, items: list[dict]) -> str:
+    """
+    Create several memberships in a project concurrently
+    
+    Args:
+        project_id: The project ID
+        items: Memberships to create; each item takes the create_membership
+            arguments except project_id (user_id or group_id is required)
+    """
+    if not items:
+        return "No memberships provided."
+    
+    c = await get_client()
+    
+    async def create(item: dict) -> Dict:
+        return await c.create_membership(_membership_data(project_id, **item))
+    
+    results = await _gather_limited(create, items, _BULK_WRITE_CONCURRENCY)
+    return _bulk_summary(
+        "Memberships", "created", results,
+        lambda m: f"Membership #{m.get('id', 'N/A')}"
+    )
 
 
 @mcp.tool()
+@tool_errors("updating membership")
 async def update_membership(
     membership_id: int,
     role_ids: Optional[list[int]] = None,
@@ -839,22 +1342,19 @@ async def update_membership(
         role_ids: Array of role IDs (optional)
         role_id: Single role ID (optional)
     """
-    try:
-        c = await get_client()
-        data = {}
-        if role_ids:
-            data["role_ids"] = role_ids
-        elif role_id:
-            data["role_id"] = role_id
-        
-        await c.update_membership(membership_id, data)
-        return f"✅ Membership #{membership_id} updated successfully"
-    except Exception as e:
-        logger.error(f"Error updating membership: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    data = {}
+    if role_ids:
+        data["role_ids"] = role_ids
+    elif role_id:
+        data["role_id"] = role_id
+    
+    await c.update_membership(membership_id, data)
+    return f"✅ Membership #{membership_id} updated successfully"
 
 
 @mcp.tool()
+@tool_errors("deleting membership")
 async def delete_membership(membership_id: int) -> str:
     """
     Delete a membership
@@ -862,16 +1362,13 @@ async def delete_membership(membership_id: int) -> str:
     Args:
         membership_id: The membership ID
     """
-    try:
-        c = await get_client()
-        await c.delete_membership(membership_id)
-        return f"✅ Membership #{membership_id} deleted successfully"
-    except Exception as e:
-        logger.error(f"Error deleting membership: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    await c.delete_membership(membership_id)
+    return f"✅ Membership #{membership_id} deleted successfully"
 
 
 @mcp.tool()
+@tool_errors("getting membership")
 async def get_membership(membership_id: int) -> str:
     """
     Get detailed information about a specific membership
@@ -879,47 +1376,56 @@ async def get_membership(membership_id: int) -> str:
     Args:
         membership_id: The membership ID
     """
-    try:
-        c = await get_client()
-        m = await c.get_membership(membership_id)
-        
-        principal = m.get("_embedded", {}).get("principal", {})
-        project = m.get("_embedded", {}).get("project", {})
-        roles = m.get("_embedded", {}).get("roles", [])
-        
-        text = f"👤 **{principal.get('name', 'N/A')}** in **{project.get('name', 'N/A')}**\n\n"
-        text += f"- **Membership ID**: {m['id']}\n"
-        text += f"- **Roles**: {', '.join([r.get('name', 'N/A') for r in roles])}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error getting membership: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    m = await c.get_membership(membership_id)
+    
+    emb = m.get("_embedded") or _EMPTY
+    principal = emb.get("principal") or _EMPTY
+    project = emb.get("project") or _EMPTY
+    roles = emb.get("roles") or ()
+    
+    parts = [
+        f"👤 **{principal.get('name', 'N/A')}** in "
+        f"**{project.get('name', 'N/A')}**\n\n"
+    ]
+    parts.append(f"- **Membership ID**: {m['id']}\n")
+    parts.append(f"- **Roles**: {', '.join(r.get('name', 'N/A') for r in roles)}\n")
+    
+    return "".join(parts)
 
 
 @mcp.tool()
-async def list_roles() -> str:
-    """List all available roles"""
-    try:
+@tool_errors("listing roles")
+async def list_roles(format: OutputFormat = "md") -> str:
+    """
+    List all available roles
+    
+    Args:
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    """
+    async def render() -> str:
         c = await get_client()
         result = await c.get_roles()
+        if format == "json":
+            return _dumps(result)
         
         roles = result.get("_embedded", {}).get("elements", [])
         
         if not roles:
             return "No roles found."
         
-        text = f"🎭 Roles ({len(roles)} found):\n\n"
+        parts = [f"🎭 Roles ({len(roles)} found):\n\n"]
         for r in roles:
-            text += f"- **{r['name']}** (ID: {r['id']})\n"
+            parts.append(f"- **{r['name']}** (ID: {r['id']})\n")
         
-        return text
-    except Exception as e:
-        logger.error(f"Error listing roles: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        return "".join(parts)
+    
+    return await _cached(f"roles:{format}", render, _CFG.reference_cache_ttl)
 
 
 @mcp.tool()
+@tool_errors("getting role")
 async def get_role(role_id: int) -> str:
     """
     Get detailed information about a specific role
@@ -927,51 +1433,80 @@ async def get_role(role_id: int) -> str:
     Args:
         role_id: The role ID
     """
-    try:
-        c = await get_client()
-        role = await c.get_role(role_id)
-        
-        text = f"🎭 **{role['name']}**\n\n"
-        text += f"- **ID**: {role['id']}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error getting role: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    role = await c.get_role(role_id)
+    
+    parts = [f"🎭 **{role['name']}**\n\n"]
+    parts.append(f"- **ID**: {role['id']}\n")
+    
+    return "".join(parts)
 
 
 @mcp.tool()
-async def list_time_entry_activities() -> str:
+@tool_errors("listing time entry activities")
+async def list_time_entry_activities(format: OutputFormat = "md") -> str:
     """
     List all available time entry activities
     
+    Args:
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    
     Returns:
         List of available time entry activities with their IDs and names
     """
-    try:
+    async def render() -> str:
         c = await get_client()
         result = await c.get_time_entry_activities()
+        if format == "json":
+            return _dumps(result)
         
         if not result.get("_embedded", {}).get("elements"):
             return "No time entry activities found"
         
-        text = f"⏱️ **Time Entry Activities** (Total: {result['total']})\n\n"
+        parts = [f"⏱️ **Time Entry Activities** (Total: {result['total']})\n\n"]
         
         for activity in result["_embedded"]["elements"]:
-            text += f"- **{activity['name']}** (ID: {activity['id']})\n"
+            parts.append(f"- **{activity['name']}** (ID: {activity['id']})\n")
             if activity.get('default'):
-                text += "  ⭐ Default activity\n"
+                parts.append("  ⭐ Default activity\n")
         
-        return text
-    except Exception as e:
-        logger.error(f"Error listing time entry activities: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        return "".join(parts)
+    
+    return await _cached(
+        f"time_entry_activities:{format}", render, _CFG.reference_cache_ttl
+    )
+
+
+# ISO 8601 durations as returned for time entry hours, e.g. "PT1H30M" or "P1DT2H"
+_DURATION = re.compile(
+    r"P(?:(\d+(?:\.\d+)?)D)?"
+    r"(?:T(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?(?:(\d+(?:\.\d+)?)S)?)?"
+)
+
+
+def _hours(duration: Optional[str]) -> float:
+    """Convert an ISO 8601 duration to hours (a day counts as 24 hours)"""
+    match = _DURATION.fullmatch(duration or "PT0H")
+    if not match:
+        return 0.0
+    days, hours, minutes, seconds = match.groups()
+    return (
+        (float(days) * 24 if days else 0.0)
+        + (float(hours) if hours else 0.0)
+        + (float(minutes) / 60 if minutes else 0.0)
+        + (float(seconds) / 3600 if seconds else 0.0)
+    )
 
 
 @mcp.tool()
+@tool_errors("listing time entries")
 async def list_time_entries(
     work_package_id: Optional[int] = None,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    offset: Optional[int] = None,
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
+    format: OutputFormat = "md"
 ) -> str:
     """
     List time entries with optional filtering
@@ -979,38 +1514,62 @@ async def list_time_entries(
     Args:
         work_package_id: Filter by specific work package (optional)
         user_id: Filter by specific user (optional)
-    """
-    try:
-        c = await get_client()
-        import json
-        filters = []
-        if work_package_id:
-            filters.append({"work_package_id": {"operator": "=", "values": [str(work_package_id)]}})
-        if user_id:
-            filters.append({"user_id": {"operator": "=", "values": [str(user_id)]}})
-        
-        filters_str = json.dumps(filters) if filters else None
-        result = await c.get_time_entries(filters=filters_str)
-        
-        entries = result.get("_embedded", {}).get("elements", [])
-        
-        if not entries:
-            return "No time entries found."
-        
-        text = f"⏱️  Time Entries ({len(entries)} found):\n\n"
-        for te in entries:
-            hours = te.get("hours", "PT0H").replace("PT", "").replace("H", "")
-            text += f"- **{hours}h** on {te.get('spentOn', 'N/A')}\n"
-            if te.get("comment", {}).get("raw"):
-                text += f"  {te['comment']['raw'][:50]}...\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error listing time entries: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        offset: Page number for pagination (optional, default: 1)
+        page_size: Number of results per page (default: 25, max: 100)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    """
+    c = await get_client()
+    filters = []
+    if work_package_id:
+        filters.append(
+            {"work_package_id": {"operator": "=", "values": [str(work_package_id)]}}
+        )
+    if user_id:
+        filters.append({"user_id": {"operator": "=", "values": [str(user_id)]}})
+    
+    filters_str = _dumps(filters) if filters else None
+    result = await c.get_time_entries(
+        filters=filters_str, offset=offset, page_size=_page_size(page_size)
+    )
+    if format == "json":
+        return _dumps(result)
+    
+    entries = result.get("_embedded", {}).get("elements", [])
+    
+    if not entries:
+        return "No time entries found."
+    
+    parts = [f"⏱️  Time Entries ({_page_info(len(entries), result, offset)}):\n\n"]
+    for te in entries:
+        hours = _hours(te.get("hours"))
+        parts.append(f"- **{hours:g}h** on {te.get('spentOn', 'N/A')}\n")
+        comment = (te.get("comment") or _EMPTY).get("raw")
+        if comment:
+            parts.append(f"  {comment[:50]}...\n")
+    
+    return "".join(parts)
+
+
+def _time_entry_data(
+    work_package_id: int,
+    hours: float,
+    spent_on: str,
+    comment: Optional[str] = None,
+    activity_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Translate create_time_entry arguments into client data"""
+    return _pack_nn((
+        ("work_package_id", work_package_id),
+        ("hours", hours),
+        ("spent_on", spent_on),
+        ("comment", comment),
+        ("activity_id", activity_id),
+    ))
 
 
 @mcp.tool()
+@tool_errors("creating time entry")
 async def create_time_entry(
     work_package_id: int,
     hours: float,
@@ -1028,26 +1587,48 @@ async def create_time_entry(
         comment: Comment/description (optional)
         activity_id: Activity ID (optional, e.g., 3 for Development)
     """
-    try:
-        c = await get_client()
-        data = {
-            "work_package_id": work_package_id,
-            "hours": hours,
-            "spent_on": spent_on
-        }
-        if comment:
-            data["comment"] = comment
-        if activity_id:
-            data["activity_id"] = activity_id
-        
-        await c.create_time_entry(data)
-        return f"✅ Time entry created: {hours}h on {spent_on}"
-    except Exception as e:
-        logger.error(f"Error creating time entry: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    data = _time_entry_data(work_package_id, hours, spent_on, comment, activity_id)
+    
+    await c.create_time_entry(data)
+    return f"✅ Time entry created: {hours}h on {spent_on}"
+
+
+@mcp.tool()
+@tool_errors("creating time entries")
+async def create_time_entries_bulk(items: list[dict]) -> str:
+    """
+    Create several time entries concurrently
+    
+    Args:
+        items: Time entries to create; each item takes the create_time_entry
+            arguments (work_package_id, hours and spent_on are required)
+    """
+    if not items:
+        return "No time entries provided."
+    
+    c = await get_client()
+    
+    async def create(item: dict) -> Dict:
+        return await c.create_time_entry(_time_entry_data(**item))
+    
+    results = await _gather_limited(create, items, _BULK_WRITE_CONCURRENCY)
+    return _bulk_summary(
+        "Time entries", "created", results,
+        lambda te: f"Time entry #{te.get('id', 'N/A')} on {te.get('spentOn', 'N/A')}"
+    )
+
+
+_TIME_ENTRY_UPDATE_FIELDS = (
+    ("hours", "hours"),
+    ("spent_on", "spent_on"),
+    ("comment", "comment"),
+    ("activity_id", "activity_id"),
+)
 
 
 @mcp.tool()
+@tool_errors("updating time entry")
 async def update_time_entry(
     time_entry_id: int,
     hours: Optional[float] = None,
@@ -1065,26 +1646,15 @@ async def update_time_entry(
         comment: Comment/description (optional)
         activity_id: Activity ID (optional)
     """
-    try:
-        c = await get_client()
-        data = {}
-        if hours is not None:
-            data["hours"] = hours
-        if spent_on is not None:
-            data["spent_on"] = spent_on
-        if comment is not None:
-            data["comment"] = comment
-        if activity_id is not None:
-            data["activity_id"] = activity_id
-        
-        await c.update_time_entry(time_entry_id, data)
-        return f"✅ Time entry #{time_entry_id} updated successfully"
-    except Exception as e:
-        logger.error(f"Error updating time entry: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    data = _pack(locals(), _TIME_ENTRY_UPDATE_FIELDS)
+    c = await get_client()
+    
+    await c.update_time_entry(time_entry_id, data)
+    return f"✅ Time entry #{time_entry_id} updated successfully"
 
 
 @mcp.tool()
+@tool_errors("deleting time entry")
 async def delete_time_entry(time_entry_id: int) -> str:
     """
     Delete a time entry
@@ -1092,45 +1662,61 @@ async def delete_time_entry(time_entry_id: int) -> str:
     Args:
         time_entry_id: The time entry ID
     """
-    try:
-        c = await get_client()
-        await c.delete_time_entry(time_entry_id)
-        return f"✅ Time entry #{time_entry_id} deleted successfully"
-    except Exception as e:
-        logger.error(f"Error deleting time entry: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    await c.delete_time_entry(time_entry_id)
+    return f"✅ Time entry #{time_entry_id} deleted successfully"
 
 
 @mcp.tool()
-async def list_versions(project_id: Optional[int] = None) -> str:
+@tool_errors("listing versions")
+async def list_versions(
+    project_id: Optional[int] = None,
+    offset: Optional[int] = None,
+    page_size: Optional[int] = _DEFAULT_PAGE_SIZE,
+    format: OutputFormat = "md"
+) -> str:
     """
     List project versions/milestones
     
     Args:
         project_id: Filter by specific project (optional)
-    """
-    try:
-        c = await get_client()
-        result = await c.get_versions(project_id=project_id)
-        
-        versions = result.get("_embedded", {}).get("elements", [])
-        
-        if not versions:
-            return "No versions found."
-        
-        text = f"📦 Versions ({len(versions)} found):\n\n"
-        for v in versions:
-            text += f"- **{v['name']}** (ID: {v['id']})\n"
-            if v.get("startDate") or v.get("endDate"):
-                text += f"  {v.get('startDate', '')} → {v.get('endDate', '')}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error listing versions: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        offset: Page number for pagination (optional, default: 1)
+        page_size: Number of results per page (default: 25, max: 100)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
+    """
+    c = await get_client()
+    result = await c.get_versions(
+        project_id=project_id, offset=offset, page_size=_page_size(page_size)
+    )
+    if format == "json":
+        return _dumps(result)
+    
+    versions = result.get("_embedded", {}).get("elements", [])
+    
+    if not versions:
+        return "No versions found."
+    
+    parts = [f"📦 Versions ({_page_info(len(versions), result, offset)}):\n\n"]
+    for v in versions:
+        parts.append(f"- **{v['name']}** (ID: {v['id']})\n")
+        if v.get("startDate") or v.get("endDate"):
+            parts.append(f"  {v.get('startDate', '')} → {v.get('endDate', '')}\n")
+    
+    return "".join(parts)
+
+
+_VERSION_FIELDS = (
+    ("name", "name"),
+    ("description", "description"),
+    ("start_date", "start_date"),
+    ("end_date", "end_date"),
+    ("status", "status"),
+)
 
 
 @mcp.tool()
+@tool_errors("creating version")
 async def create_version(
     project_id: int,
     name: str,
@@ -1150,26 +1736,15 @@ async def create_version(
         end_date: End date (YYYY-MM-DD format, optional)
         status: Version status (open, locked, closed) (optional)
     """
-    try:
-        c = await get_client()
-        data = {"name": name}
-        if description:
-            data["description"] = description
-        if start_date:
-            data["start_date"] = start_date
-        if end_date:
-            data["end_date"] = end_date
-        if status:
-            data["status"] = status
-        
-        await c.create_version(project_id, data)
-        return f"✅ Version created: **{name}**"
-    except Exception as e:
-        logger.error(f"Error creating version: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    data = _pack(locals(), _VERSION_FIELDS)
+    c = await get_client()
+    
+    await c.create_version(project_id, data)
+    return f"✅ Version created: **{name}**"
 
 
 @mcp.tool()
+@tool_errors("setting parent")
 async def set_work_package_parent(work_package_id: int, parent_id: int) -> str:
     """
     Set a parent for a work package (create parent-child relationship)
@@ -1178,16 +1753,13 @@ async def set_work_package_parent(work_package_id: int, parent_id: int) -> str:
         work_package_id: The work package ID to become a child
         parent_id: The work package ID to become the parent
     """
-    try:
-        c = await get_client()
-        await c.set_work_package_parent(work_package_id, parent_id)
-        return f"✅ Work package #{work_package_id} is now a child of #{parent_id}"
-    except Exception as e:
-        logger.error(f"Error setting parent: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    await c.set_work_package_parent(work_package_id, parent_id)
+    return f"✅ Work package #{work_package_id} is now a child of #{parent_id}"
 
 
 @mcp.tool()
+@tool_errors("removing parent")
 async def remove_work_package_parent(work_package_id: int) -> str:
     """
     Remove parent relationship from a work package (make it top-level)
@@ -1195,19 +1767,17 @@ async def remove_work_package_parent(work_package_id: int) -> str:
     Args:
         work_package_id: The work package ID to remove parent from
     """
-    try:
-        c = await get_client()
-        await c.remove_work_package_parent(work_package_id)
-        return f"✅ Work package #{work_package_id} is now top-level"
-    except Exception as e:
-        logger.error(f"Error removing parent: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    await c.remove_work_package_parent(work_package_id)
+    return f"✅ Work package #{work_package_id} is now top-level"
 
 
 @mcp.tool()
+@tool_errors("listing children")
 async def list_work_package_children(
     parent_id: int,
-    include_descendants: bool = False
+    include_descendants: bool = False,
+    format: OutputFormat = "md"
 ) -> str:
     """
     List all child work packages of a parent
@@ -1215,27 +1785,39 @@ async def list_work_package_children(
     Args:
         parent_id: The parent work package ID
         include_descendants: Include grandchildren and all descendants (default: False)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
     """
+    c = await get_client()
+    result = await c.list_work_package_children(parent_id, include_descendants)
+    if format == "json":
+        return _dumps(result)
+    
     try:
-        c = await get_client()
-        result = await c.list_work_package_children(parent_id, include_descendants)
-        
-        children = result.get("_embedded", {}).get("elements", [])
-        
-        if not children:
-            return f"No children found for work package #{parent_id}."
-        
-        text = f"👶 Children of #{parent_id} ({len(children)} found):\n\n"
-        for wp in children:
-            text += f"#{wp['id']} - **{wp['subject']}**\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error listing children: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        children = result["_embedded"]["elements"]
+    except KeyError:
+        children = ()
+    
+    if not children:
+        return f"No children found for work package #{parent_id}."
+    
+    parts = [f"👶 Children of #{parent_id} ({len(children)} found):\n\n"]
+    for wp in children:
+        parts.append(f"#{wp['id']} - **{wp['subject']}**\n")
+    
+    return "".join(parts)
+
+
+# Relations and the current user change rarely within a session
+_RELATION_CACHE_TTL = 30.0
+_PERMISSIONS_CACHE_TTL = 60.0
+
+# Concurrent requests issued by the bulk relation tools
+_RELATION_BULK_CONCURRENCY = 10
 
 
 @mcp.tool()
+@tool_errors("creating relation")
 async def create_work_package_relation(
     from_id: int,
     to_id: int,
@@ -1253,29 +1835,64 @@ async def create_work_package_relation(
         lag: Lag in working days (optional, for follows/precedes)
         description: Optional description of the relation
     """
-    try:
-        c = await get_client()
-        data = {
-            "from_id": from_id,
-            "to_id": to_id,
-            "relation_type": relation_type
-        }
-        if lag is not None:
-            data["lag"] = lag
-        if description:
-            data["description"] = description
-        
-        await c.create_work_package_relation(data)
-        return f"✅ Relation created: #{from_id} {relation_type} #{to_id}"
-    except Exception as e:
-        logger.error(f"Error creating relation: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    data = _pack_nn((
+        ("from_id", from_id),
+        ("to_id", to_id),
+        ("relation_type", relation_type),
+        ("lag", lag),
+        ("description", description),
+    ))
+    
+    await c.create_work_package_relation(data)
+    _cache_invalidate("relations:list:")
+    return f"✅ Relation created: #{from_id} {relation_type} #{to_id}"
+
+
+def _relation_line(r: Dict[str, Any]) -> str:
+    """Render one relation, tolerating missing embedded work packages"""
+    emb = r.get("_embedded") or _EMPTY
+    from_wp = emb.get("from") or _EMPTY
+    to_wp = emb.get("to") or _EMPTY
+    return (
+        f"#{from_wp.get('id', 'N/A')} {r.get('type', 'N/A')} "
+        f"#{to_wp.get('id', 'N/A')}\n"
+    )
+
+
+# Detail view of a single relation, filled from _flatten_relation()
+_TMPL_RELATION = (
+    "🔗 Relation #{id}\n\n"
+    "- **Type**: {type}\n"
+    "- **From**: #{from_id} - {from_subject}\n"
+    "- **To**: #{to_id} - {to_subject}\n"
+    "{lag_line}"
+)
+
+
+def _flatten_relation(r: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the fields used by _TMPL_RELATION, with N/A for missing ones"""
+    emb = r.get("_embedded") or _EMPTY
+    from_wp = emb.get("from") or _EMPTY
+    to_wp = emb.get("to") or _EMPTY
+    lag = r.get("lag")
+    return {
+        "id": r.get("id", "N/A"),
+        "type": r.get("type", "N/A"),
+        "from_id": from_wp.get("id", "N/A"),
+        "from_subject": from_wp.get("subject", "N/A"),
+        "to_id": to_wp.get("id", "N/A"),
+        "to_subject": to_wp.get("subject", "N/A"),
+        "lag_line": f"- **Lag**: {lag} days\n" if lag else "",
+    }
 
 
 @mcp.tool()
+@tool_errors("listing relations")
 async def list_work_package_relations(
     work_package_id: Optional[int] = None,
-    relation_type: Optional[str] = None
+    relation_type: Optional[str] = None,
+    format: OutputFormat = "md"
 ) -> str:
     """
     List work package relations with optional filtering
@@ -1283,37 +1900,64 @@ async def list_work_package_relations(
     Args:
         work_package_id: Filter relations involving this work package ID (optional)
         relation_type: Filter by relation type (optional)
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
     """
-    try:
+    filters = []
+    if work_package_id:
+        filters.append(
+            {"involved": {"operator": "=", "values": [str(work_package_id)]}}
+        )
+    if relation_type:
+        filters.append({"type": {"operator": "=", "values": [relation_type]}})
+    
+    filters_str = _dumps(filters) if filters else None
+    
+    async def render() -> str:
         c = await get_client()
-        import json
-        filters = []
-        if work_package_id:
-            filters.append({"involved": {"operator": "=", "values": [str(work_package_id)]}})
-        if relation_type:
-            filters.append({"type": {"operator": "=", "values": [relation_type]}})
-        
-        filters_str = json.dumps(filters) if filters else None
         result = await c.list_work_package_relations(filters=filters_str)
+        if format == "json":
+            return _dumps(result)
         
-        relations = result.get("_embedded", {}).get("elements", [])
+        try:
+            relations = result["_embedded"]["elements"]
+        except KeyError:
+            relations = ()
         
         if not relations:
             return "No relations found."
         
-        text = f"🔗 Work Package Relations ({len(relations)} found):\n\n"
-        for r in relations:
-            from_wp = r.get("_embedded", {}).get("from", {})
-            to_wp = r.get("_embedded", {}).get("to", {})
-            text += f"#{from_wp.get('id', 'N/A')} {r.get('type', 'N/A')} #{to_wp.get('id', 'N/A')}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error listing relations: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        header = f"🔗 Work Package Relations ({len(relations)} found):\n\n"
+        try:
+            return header + "".join(
+                f"#{r['_embedded']['from']['id']} {r['type']} "
+                f"#{r['_embedded']['to']['id']}\n"
+                for r in relations
+            )
+        except (KeyError, TypeError):
+            # Some relation lacks an embedded end; render all with placeholders
+            return header + "".join(_relation_line(r) for r in relations)
+    
+    return await _cached(
+        f"relations:list:{format}:{filters_str}", render, _RELATION_CACHE_TTL
+    )
+
+
+def _relation_update_data(
+    relation_type: Optional[str] = None,
+    lag: Optional[int] = None,
+    description: Optional[str] = None
+) -> Dict[str, Any]:
+    """Translate update_work_package_relation arguments into client data"""
+    return _pack_nn((
+        ("relation_type", relation_type),
+        ("lag", lag),
+        ("description", description),
+    ))
 
 
 @mcp.tool()
+@tool_errors("updating relation")
 async def update_work_package_relation(
     relation_id: int,
     relation_type: Optional[str] = None,
@@ -1329,24 +1973,51 @@ async def update_work_package_relation(
         lag: Lag in working days (optional)
         description: Optional description (optional)
     """
-    try:
-        c = await get_client()
-        data = {}
-        if relation_type is not None:
-            data["relation_type"] = relation_type
-        if lag is not None:
-            data["lag"] = lag
-        if description is not None:
-            data["description"] = description
-        
-        await c.update_work_package_relation(relation_id, data)
-        return f"✅ Relation #{relation_id} updated successfully"
-    except Exception as e:
-        logger.error(f"Error updating relation: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    data = _relation_update_data(relation_type, lag, description)
+    
+    await c.update_work_package_relation(relation_id, data)
+    _cache_invalidate("relations:list:")
+    _cache_invalidate(f"relations:{relation_id}:")
+    return f"✅ Relation #{relation_id} updated successfully"
+
+
+@mcp.tool()
+@tool_errors("updating relations")
+async def update_work_package_relations_bulk(items: list[dict]) -> str:
+    """
+    Update several work package relations concurrently
+    
+    Args:
+        items: Relations to update; each item takes the
+            update_work_package_relation arguments (relation_id is required)
+    """
+    if not items:
+        return "No relations provided."
+    
+    c = await get_client()
+    
+    async def update(item: dict) -> Dict:
+        fields = dict(item)
+        relation_id = fields.pop("relation_id")
+        return await c.update_work_package_relation(
+            relation_id, _relation_update_data(**fields)
+        )
+    
+    results = await _gather_limited(update, items, _RELATION_BULK_CONCURRENCY)
+    
+    _cache_invalidate("relations:list:")
+    for item in items:
+        _cache_invalidate(f"relations:{item.get('relation_id')}:")
+    
+    return _bulk_summary(
+        "Relations", "updated", results,
+        lambda r: f"Relation #{r.get('id', 'N/A')} ({r.get('type', 'N/A')})"
+    )
 
 
 @mcp.tool()
+@tool_errors("deleting relation")
 async def delete_work_package_relation(relation_id: int) -> str:
     """
     Delete a work package relation
@@ -1354,87 +2025,147 @@ async def delete_work_package_relation(relation_id: int) -> str:
     Args:
         relation_id: The relation ID
     """
-    try:
-        c = await get_client()
-        await c.delete_work_package_relation(relation_id)
-        return f"✅ Relation #{relation_id} deleted successfully"
-    except Exception as e:
-        logger.error(f"Error deleting relation: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+    c = await get_client()
+    await c.delete_work_package_relation(relation_id)
+    _cache_invalidate("relations:list:")
+    _cache_invalidate(f"relations:{relation_id}:")
+    return f"✅ Relation #{relation_id} deleted successfully"
 
 
 @mcp.tool()
-async def get_work_package_relation(relation_id: int) -> str:
+@tool_errors("getting relation")
+async def get_work_package_relation(
+    relation_id: int, format: OutputFormat = "md"
+) -> str:
     """
     Get detailed information about a specific work package relation
     
     Args:
         relation_id: The relation ID
+        format: "md" for formatted Markdown (default) or "json" for the raw API
+            response, for programmatic consumers
     """
-    try:
+    async def render() -> str:
         c = await get_client()
         r = await c.get_work_package_relation(relation_id)
+        if format == "json":
+            return _dumps(r)
         
-        from_wp = r.get("_embedded", {}).get("from", {})
-        to_wp = r.get("_embedded", {}).get("to", {})
-        
-        text = f"🔗 Relation #{r['id']}\n\n"
-        text += f"- **Type**: {r.get('type', 'N/A')}\n"
-        text += f"- **From**: #{from_wp.get('id', 'N/A')} - {from_wp.get('subject', 'N/A')}\n"
-        text += f"- **To**: #{to_wp.get('id', 'N/A')} - {to_wp.get('subject', 'N/A')}\n"
-        if r.get("lag"):
-            text += f"- **Lag**: {r['lag']} days\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error getting relation: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        return _TMPL_RELATION.format_map(_flatten_relation(r))
+    
+    return await _cached(
+        f"relations:{relation_id}:{format}", render, _RELATION_CACHE_TTL
+    )
+
+
+@mcp.tool()
+@tool_errors("getting relations")
+async def get_work_package_relations_bulk(
+    relation_ids: list[int],
+    format: OutputFormat = "md"
+) -> str:
+    """
+    Get several work package relations at once, fetching them concurrently
+    
+    Args:
+        relation_ids: List of relation IDs
+        format: "md" for a Markdown table (default) or "json" for the raw API
+            responses, with {"id", "error"} entries for failed lookups
+    """
+    if not relation_ids:
+        return "No relation IDs provided."
+    
+    c = await get_client()
+    results = await _gather_limited(
+        c.get_work_package_relation, relation_ids, _RELATION_BULK_CONCURRENCY
+    )
+    if format == "json":
+        return _dumps([
+            {"id": relation_id, "error": str(r)} if isinstance(r, Exception) else r
+            for relation_id, r in zip(relation_ids, results)
+        ])
+    
+    parts = [
+        f"🔗 Relations ({len(relation_ids)} requested):\n\n",
+        "| ID | Type | From | To | Lag |\n",
+        "|----|------|------|----|-----|\n",
+    ]
+    for relation_id, r in zip(relation_ids, results):
+        if isinstance(r, Exception):
+            error = str(r).replace("|", "\\|").replace("\n", " ")
+            parts.append(f"| {relation_id} | ❌ {error} | | | |\n")
+            continue
+        emb = r.get("_embedded") or _EMPTY
+        from_wp = emb.get("from") or _EMPTY
+        to_wp = emb.get("to") or _EMPTY
+        parts.append(
+            f"| {r.get('id', relation_id)} | {r.get('type', 'N/A')} "
+            f"| #{from_wp.get('id', 'N/A')} | #{to_wp.get('id', 'N/A')} "
+            f"| {r.get('lag') or ''} |\n"
+        )
+    
+    return "".join(parts)
 
 
 @mcp.tool()
+@tool_errors("checking permissions")
 async def check_permissions() -> str:
     """Check user permissions and capabilities"""
-    try:
+    async def render() -> str:
         c = await get_client()
         user = await c.check_permissions()
         
-        text = f"👤 Current User: **{user.get('name', 'N/A')}**\n\n"
-        text += f"- **ID**: {user['id']}\n"
-        text += f"- **Login**: {user.get('login', 'N/A')}\n"
-        text += f"- **Email**: {user.get('email', 'N/A')}\n"
-        text += f"- **Admin**: {user.get('admin', False)}\n"
-        
-        return text
-    except Exception as e:
-        logger.error(f"Error checking permissions: {e}", exc_info=True)
-        return f"❌ Error: {str(e)}"
+        return "".join((
+            f"👤 Current User: **{user.get('name', 'N/A')}**\n\n",
+            f"- **ID**: {user['id']}\n",
+            f"- **Login**: {user.get('login', 'N/A')}\n",
+            f"- **Email**: {user.get('email', 'N/A')}\n",
+            f"- **Admin**: {user.get('admin', False)}\n",
+        ))
+    
+    return await _cached("permissions", render, _PERMISSIONS_CACHE_TTL)
 
 
 # ============================================================================
 # Server Initialization
 # ============================================================================
 
+async def _run_http() -> None:
+    """Run FastMCP server with built-in HTTP support"""
+    logger.info(
+        "🚀 Starting HTTP server on http://%s:%s", _CFG.http_host, _CFG.http_port
+    )
+    await mcp.run_http_async(host=_CFG.http_host, port=_CFG.http_port)
+
+
+async def _run_stdio() -> None:
+    """Run with stdio transport"""
+    logger.info("🚀 Starting stdio transport")
+    await mcp.run_stdio_async()
+
+
+# Transport runners, selected by _CFG.transport (USE_HTTP_TRANSPORT)
+_TRANSPORTS = {"http": _run_http, "stdio": _run_stdio}
+
+
 async def main():
     """Main entry point"""
-    logger.info(f"Starting OpenProject MCP Server v{__version__}")
-    
-    # Check transport mode
-    use_http = os.getenv("USE_HTTP_TRANSPORT", "true").lower() == "true"
-    
-    if use_http:
-        host = os.getenv("HTTP_HOST", "0.0.0.0")
-        port = int(os.getenv("HTTP_PORT", "8008"))
-        
-        logger.info(f"🚀 Starting HTTP server on http://{host}:{port}")
-        
-        # Run FastMCP server with built-in HTTP support
-        await mcp.run_http_async(host=host, port=port)
+    logger.info("Starting OpenProject MCP Server v%s", __version__)
+    try:
+        await _TRANSPORTS[_CFG.transport]()
+    finally:
+        # Release pooled HTTP connections on shutdown
+        if client is not None:
+            await client.aclose()
+
+
+def run() -> None:
+    """Run the server, on uvloop's event loop when it is installed"""
+    if uvloop is not None:
+        uvloop.run(main())
     else:
-        # Run with stdio transport
-        logger.info("🚀 Starting stdio transport")
-        await mcp.run_stdio_async()
+        asyncio.run(main())
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    run()